@@ -1,9 +1,8 @@
-from openai import pydantic_function_tool
-from openai.types.chat import ChatCompletionFunctionToolParam
+from typing import Type
 
 from sgr_deep_research.core import FinalAnswerTool, ReasoningTool
 from sgr_deep_research.core.agents.sgr_tool_calling_agent import SGRToolCallingAgent
-from sgr_deep_research.core.tools import ExtractPageContentTool, WebSearchTool
+from sgr_deep_research.core.tools import BaseTool, ExtractPageContentTool, WebSearchTool
 
 
 class BenchmarkAgent(SGRToolCallingAgent):
@@ -24,8 +23,8 @@ class BenchmarkAgent(SGRToolCallingAgent):
             FinalAnswerTool,
         ]
 
-    async def _prepare_tools(self) -> list[ChatCompletionFunctionToolParam]:
-        """Prepare available tools for current agent state and progress."""
+    def _available_tools(self) -> set[Type[BaseTool]]:
+        """Tool classes available for current agent state and progress."""
         tools = set(self.toolkit)
         if self._context.iteration >= self.max_iterations:
             tools = {
@@ -37,7 +36,7 @@ class BenchmarkAgent(SGRToolCallingAgent):
                 WebSearchTool,
             }
 
-        return [pydantic_function_tool(tool, name=tool.tool_name, description="") for tool in tools]
+        return tools
 
     async def execute(
         self,
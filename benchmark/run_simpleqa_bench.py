@@ -15,6 +15,7 @@ from benchmark.utils import (
     save_result,
 )
 from sgr_deep_research.core.agent_config import GlobalConfig
+from sgr_deep_research.core.services import LLMClientPool
 
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 config_path = os.path.join(project_root, "config.yaml")
@@ -28,9 +29,15 @@ logger = logging.getLogger(__name__)
 logger.info(f"Using config file: {config_path}")
 
 
-async def benchmark_agent(question, answer, model_config) -> Dict[str, Any]:
+async def benchmark_agent(question, answer, model_config, fused_reasoning: bool = False) -> Dict[str, Any]:
     system_conf = GlobalConfig()
-    agent = BenchmarkAgent(task=question, max_iterations=system_conf.execution.max_iterations)
+    agent = BenchmarkAgent(
+        task=question,
+        openai_client=LLMClientPool.get_client(system_conf.llm),
+        llm_config=system_conf.llm,
+        prompts_config=system_conf.prompts,
+        execution_config=system_conf.execution.model_copy(update={"fused_reasoning": fused_reasoning}),
+    )
 
     try:
         await agent.execute()
@@ -82,6 +89,7 @@ async def main(
     results_task: List[Dict[str, Any]] = None,
     batch_size: int = 3,
     start_idx: int = 0,
+    fused_reasoning: bool = False,
 ):
     results = results_task if results_task else []
 
@@ -99,7 +107,10 @@ async def main(
         logger.debug(f"Batch tasks: {batch_tasks}")
 
         batch_results = await asyncio.gather(
-            *[benchmark_agent(question, answer, judge_model_config) for question, answer in zip(*batch_tasks)]
+            *[
+                benchmark_agent(question, answer, judge_model_config, fused_reasoning)
+                for question, answer in zip(*batch_tasks)
+            ]
         )
 
         results.extend(batch_results)
@@ -124,6 +135,7 @@ async def main(
     metrics_path = output_path.replace(".xlsx", "_metrics.txt")
 
     with open(metrics_path, "w", encoding="utf-8") as f:
+        f.write(f"Fused reasoning: {fused_reasoning}\n")
         f.write(f"F1 score: {metric_f1}\n")
         f.write(f"Accuracy: {accuracy}\n")
         f.write(f"Number of correct: {num_correct}\n")
@@ -132,6 +144,7 @@ async def main(
         f.write(f"Number of failed_search: {num_failed_search}\n")
 
     logger.info("Calculating F1...")
+    logger.info(f"Fused reasoning: {fused_reasoning}")
     logger.info(f"F1 score: {metric_f1}")
     logger.info(f"Accuracy: {accuracy}")
     logger.info(f"Number of correct: {num_correct}")
@@ -174,6 +187,12 @@ if __name__ == "__main__":
         help="Number of samples to process from simpleqa",
     )
 
+    parser.add_argument(
+        "--fused_reasoning",
+        action="store_true",
+        help="Produce reasoning and action in one LLM call per step to compare accuracy with the default mode",
+    )
+
     args = parser.parse_args()
 
     judge_model_config = {
@@ -218,5 +237,6 @@ if __name__ == "__main__":
             results_task=results_tasks,
             batch_size=batch_size,
             start_idx=start_idx,
+            fused_reasoning=args.fused_reasoning,
         )
     )
@@ -8,9 +8,10 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from sgr_deep_research import AgentFactory, __version__
-from sgr_deep_research.api.endpoints import router
-from sgr_deep_research.core import AgentRegistry, ToolRegistry
+from sgr_deep_research.api.endpoints import agents_scheduler, agents_storage, agents_workers, router
+from sgr_deep_research.core import AgentRegistry, LLMClientPool, ToolRegistry
 from sgr_deep_research.core.agent_config import GlobalConfig
+from sgr_deep_research.core.services import TavilySearchService
 from sgr_deep_research.default_definitions import get_default_agents_definitions
 from sgr_deep_research.settings import ServerConfig, setup_logging
 
@@ -26,7 +27,15 @@ async def lifespan(app: FastAPI):
         logger.info(f"Agent registered: {agent.__name__}")
     for defn in AgentFactory.get_definitions_list():
         logger.info(f"Agent definition loaded: {defn}")
+    if agents_workers.enabled:
+        args = ServerConfig()
+        agents_workers.start(config_file=args.config_file, agents_file=args.agents_file, logging_file=args.logging_file)
     yield
+    await agents_scheduler.cancel_all()
+    await agents_workers.stop()
+    await LLMClientPool.close_all()
+    await TavilySearchService.close_all()
+    agents_storage.close()
 
 
 def main():
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 
 from fastapi import APIRouter, HTTPException
@@ -12,16 +11,17 @@ from sgr_deep_research.api.models import (
     ClarificationRequest,
     HealthResponse,
 )
-from sgr_deep_research.core import BaseAgent
 from sgr_deep_research.core.agent_factory import AgentFactory
 from sgr_deep_research.core.models import AgentStatesEnum
+from sgr_deep_research.core.services import AgentQueueFullError, AgentScheduler, AgentStore, AgentWorkerPool
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# ToDo: better to move to a separate service
-agents_storage: dict[str, BaseAgent] = {}
+agents_storage = AgentStore()
+agents_scheduler = AgentScheduler()
+agents_workers = AgentWorkerPool()
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -31,29 +31,23 @@ async def health_check():
 
 @router.get("/agents/{agent_id}/state", response_model=AgentStateResponse)
 async def get_agent_state(agent_id: str):
-    if agent_id not in agents_storage:
+    snapshot = await agents_storage.get_snapshot(agent_id)
+    if snapshot is None:
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    agent = agents_storage[agent_id]
-
-    return AgentStateResponse(
-        agent_id=agent.id,
-        task=agent.task,
-        sources_count=len(agent._context.sources),
-        **agent._context.model_dump(),
-    )
+    return AgentStateResponse(**snapshot.model_dump())
 
 
 @router.get("/agents", response_model=AgentListResponse)
 async def get_agents_list():
     agents_list = [
         AgentListItem(
-            agent_id=agent.id,
-            task=agent.task,
-            state=agent._context.state,
-            creation_time=agent.creation_time,
+            agent_id=snapshot.agent_id,
+            task=snapshot.task,
+            state=snapshot.state,
+            creation_time=snapshot.creation_time,
         )
-        for agent in agents_storage.values()
+        for snapshot in await agents_storage.list_snapshots()
     ]
 
     return AgentListResponse(agents=agents_list, total=len(agents_list))
@@ -141,11 +135,18 @@ async def create_chat_completion(request: ChatCompletionRequest):
                 detail=f"Invalid model '{request.model}'. "
                 f"Available models: {[ad.name for ad in AgentFactory.get_definitions_list()]}",
             )
-        agent = await AgentFactory.create(agent_def, task)
+        if agents_workers.started:
+            agent = agents_workers.create_agent(agent_def.name, task)
+        else:
+            agent = await AgentFactory.create(agent_def, task)
         logger.info(f"Created agent '{request.model}' for task: {task[:100]}...")
 
-        agents_storage[agent.id] = agent
-        _ = asyncio.create_task(agent.execute())
+        try:
+            queue_position = agents_scheduler.submit(agent, agent_def.name)
+        except AgentQueueFullError as e:
+            logger.warning(f"Rejected agent '{request.model}': {e}")
+            raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+        await agents_storage.add(agent)
         return StreamingResponse(
             agent.streaming_generator.stream(),
             media_type="text/plain",
@@ -154,6 +155,7 @@ async def create_chat_completion(request: ChatCompletionRequest):
                 "Connection": "keep-alive",
                 "X-Agent-ID": str(agent.id),
                 "X-Agent-Model": request.model,
+                "X-Queue-Position": str(queue_position),
             },
         )
 
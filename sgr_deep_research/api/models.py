@@ -5,6 +5,8 @@ from typing import Any, Dict, List, Literal
 
 from pydantic import BaseModel, Field
 
+from sgr_deep_research.core.models import TokenUsage
+
 
 class ChatMessage(BaseModel):
     """Chat message."""
@@ -63,6 +65,10 @@ class AgentStateResponse(BaseModel):
     sources_count: int = Field(description="Number of sources found")
     current_step_reasoning: Dict[str, Any] | None = Field(default=None, description="Current agent step")
     execution_result: str | None = Field(default=None, description="Execution result")
+    token_usage: TokenUsage = Field(default_factory=TokenUsage, description="Total LLM token usage")
+    phase_token_usage: Dict[str, TokenUsage] = Field(
+        default_factory=dict, description="LLM token usage per agent phase"
+    )
 
 
 class AgentListItem(BaseModel):
@@ -14,6 +14,7 @@ from sgr_deep_research.core.base_tool import BaseTool
 from sgr_deep_research.core.models import AgentStatesEnum, ResearchContext, SearchResult, SourceData
 from sgr_deep_research.core.services import (
     AgentRegistry, 
+    LLMClientPool,
     # MCP2ToolConverter, 
     PromptLoader, 
     ToolRegistry
@@ -38,6 +39,7 @@ __all__ = [
     "AgentRegistry",
     "ToolRegistry",
     "PromptLoader",
+    "LLMClientPool",
     # "MCP2ToolConverter",
     # Models
     "AgentStatesEnum",
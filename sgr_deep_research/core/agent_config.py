@@ -3,9 +3,10 @@ from pathlib import Path
 from typing import ClassVar, Self
 
 import yaml
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from sgr_deep_research.core.agent_definition import AgentConfig, Definitions
+from sgr_deep_research.core.agent_definition import AgentConfig, AgentStoreConfig, Definitions, SchedulerConfig
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +15,9 @@ class GlobalConfig(BaseSettings, AgentConfig, Definitions):
     _instance: ClassVar[Self | None] = None
     _initialized: ClassVar[bool] = False
 
+    agent_store: AgentStoreConfig = Field(default_factory=AgentStoreConfig, description="API agent store settings")
+    scheduler: SchedulerConfig = Field(default_factory=SchedulerConfig, description="API agent scheduler settings")
+
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
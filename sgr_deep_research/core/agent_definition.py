@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any, Self
 
 import yaml
+
 # from fastmcp.mcp_config import MCPConfig
 from pydantic import BaseModel, Field, FilePath, ImportString, computed_field, field_validator, model_validator
 
@@ -21,6 +22,10 @@ class LLMConfig(BaseModel):
     proxy: str | None = Field(
         default=None, description="Proxy URL (e.g., socks5://127.0.0.1:1081 or http://127.0.0.1:8080)"
     )
+    max_connections: int = Field(default=100, gt=0, description="Maximum connections in shared client pool")
+    max_keepalive_connections: int = Field(default=20, ge=0, description="Maximum idle keep-alive connections")
+    keepalive_expiry: float = Field(default=30.0, gt=0, description="Idle keep-alive connection expiry in seconds")
+    http2: bool = Field(default=False, description="Use HTTP/2 for LLM requests (requires 'h2' package)")
 
 
 class SearchConfig(BaseModel):
@@ -31,6 +36,22 @@ class SearchConfig(BaseModel):
     max_pages: int = Field(default=5, gt=0, description="Maximum pages to scrape")
     content_limit: int = Field(default=1500, gt=0, description="Content character limit per source")
 
+    max_connections: int = Field(default=50, gt=0, description="Maximum connections in shared search client pool")
+    max_keepalive_connections: int = Field(default=10, ge=0, description="Maximum idle keep-alive connections")
+
+    cache_ttl: float = Field(default=3600.0, ge=0, description="Search results cache TTL in seconds, 0 disables cache")
+    cache_stale_ttl: float = Field(
+        default=0.0, ge=0, description="Seconds to serve expired results while revalidating them in background"
+    )
+    cache_max_entries: int = Field(default=1000, gt=0, description="Maximum search results kept in memory cache")
+    cache_path: str | None = Field(default=None, description="SQLite file for persistent cache tier")
+
+    page_cache_ttl: float = Field(default=86400.0, ge=0, description="Extracted pages cache TTL, 0 disables cache")
+    page_cache_failed_ttl: float = Field(default=600.0, ge=0, description="How long failed URLs are not retried")
+    page_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024, gt=0, description="Size bound for extracted pages in each cache tier"
+    )
+
 
 class PromptsConfig(BaseModel):
     system_prompt_file: FilePath | None = Field(
@@ -48,6 +69,10 @@ class PromptsConfig(BaseModel):
     system_prompt_str: str | None = None
     initial_user_request_str: str | None = None
     clarification_response_str: str | None = None
+    current_date_format: str = Field(
+        default="%Y-%m-%d %H:%M:%S",
+        description="strftime format of {current_date} in prompts, coarser formats keep prompt prefix cacheable",
+    )
 
     @computed_field
     @cached_property
@@ -104,11 +129,55 @@ class ExecutionConfig(BaseModel, extra="allow"):
     max_iterations: int = Field(default=10, gt=0, description="Maximum number of iterations")
     max_searches: int = Field(default=4, ge=0, description="Maximum number of searches")
     mcp_context_limit: int = Field(default=15000, gt=0, description="Maximum context length from MCP server response")
+    parallel_tool_calls: bool = Field(default=False, description="Run several tool calls per step concurrently")
+    max_parallel_tool_calls: int = Field(default=3, gt=0, description="Maximum tool calls executed in one step")
+    fused_reasoning: bool = Field(
+        default=False, description="Produce reasoning and action in one LLM call per step (SGR tool calling agents)"
+    )
+    token_budget: int = Field(default=0, ge=0, description="Total LLM tokens per agent run, 0 means unlimited")
+    token_budget_reserve: int = Field(
+        default=10000, ge=0, description="Tokens kept for the final answer, agent is forced to finish below it"
+    )
+    compaction_threshold_tokens: int = Field(
+        default=60000, ge=0, description="Estimated prompt size that triggers context compaction, 0 disables it"
+    )
+    compaction_keep_last: int = Field(default=4, ge=0, description="Most recent tool results never compacted")
+    compaction_stub_chars: int = Field(default=500, gt=0, description="Characters kept from each compacted result")
+    compaction_model: str | None = Field(
+        default=None, description="Cheap model summarizing compacted tool results instead of truncating them"
+    )
 
     logs_dir: str = Field(default="logs", description="Directory for saving bot logs")
     reports_dir: str = Field(default="reports", description="Directory for saving reports")
 
 
+class AgentStoreConfig(BaseModel):
+    """Limits of the API agent store."""
+
+    max_agents: int = Field(default=1000, gt=0, description="Maximum agents kept in memory")
+    max_memory_bytes: int = Field(
+        default=512 * 1024 * 1024, ge=0, description="Estimated memory bound of agents in store, 0 disables it"
+    )
+    finished_ttl: float = Field(default=3600.0, ge=0, description="Seconds finished agents stay in memory")
+    snapshot_ttl: float = Field(default=7 * 86400.0, gt=0, description="Seconds state of evicted agents is kept")
+    max_snapshots: int = Field(default=10000, gt=0, description="Maximum states of evicted agents kept")
+    db_path: str | None = Field(default=None, description="SQLite file for states of evicted agents")
+
+
+class SchedulerConfig(BaseModel):
+    """Admission control for agent executions in API."""
+
+    max_running_agents: int = Field(default=10, gt=0, description="Maximum agents executing at once")
+    max_queued_agents: int = Field(default=50, ge=0, description="Maximum agents waiting for a free slot")
+    definition_limits: dict[str, int] = Field(
+        default_factory=dict, description="Maximum agents executing at once per agent definition name"
+    )
+    retry_after: int = Field(default=30, gt=0, description="Retry-After seconds sent when the queue is full")
+    worker_processes: int = Field(
+        default=0, ge=0, description="Processes executing agents outside the API process, 0 runs agents in-process"
+    )
+
+
 class AgentConfig(BaseModel):
     llm: LLMConfig = Field(default_factory=LLMConfig, description="LLM settings")
     search: SearchConfig | None = Field(default=None, description="Search settings")
@@ -144,7 +213,7 @@ class AgentDefinition(AgentConfig):
         )
         data["prompts"] = GlobalConfig().prompts.model_copy(update=data.get("prompts", {})).model_dump()
         data["execution"] = GlobalConfig().execution.model_copy(update=data.get("execution", {})).model_dump()
-        data["mcp"] = GlobalConfig().mcp.model_copy(update=data.get("mcp", {})).model_dump(warnings=False)
+        # data["mcp"] = GlobalConfig().mcp.model_copy(update=data.get("mcp", {})).model_dump(warnings=False)
         return data
 
     @model_validator(mode="after")
@@ -3,7 +3,6 @@
 import logging
 from typing import Type, TypeVar
 
-import httpx
 from openai import AsyncOpenAI
 
 from sgr_deep_research.core.agent_config import GlobalConfig
@@ -11,6 +10,7 @@ from sgr_deep_research.core.agent_definition import AgentDefinition, LLMConfig
 from sgr_deep_research.core.base_agent import BaseAgent
 from sgr_deep_research.core.services import(
     AgentRegistry, 
+    LLMClientPool,
     # MCP2ToolConverter, 
     ToolRegistry
 )
@@ -29,19 +29,15 @@ class AgentFactory:
 
     @classmethod
     def _create_client(cls, llm_config: LLMConfig) -> AsyncOpenAI:
-        """Create OpenAI client from configuration.
+        """Get OpenAI client for configuration from the shared client pool.
 
         Args:
             llm_config: LLM configuration
 
         Returns:
-            Configured AsyncOpenAI client
+            Configured AsyncOpenAI client, shared between agents with the same LLM setup
         """
-        client_kwargs = {"base_url": llm_config.base_url, "api_key": llm_config.api_key}
-        if llm_config.proxy:
-            client_kwargs["http_client"] = httpx.AsyncClient(proxy=llm_config.proxy)
-
-        return AsyncOpenAI(**client_kwargs)
+        return LLMClientPool.get_client(llm_config)
 
     @classmethod
     async def create(cls, agent_def: AgentDefinition, task: str) -> Agent:
@@ -42,7 +42,7 @@ class SGRAgent(BaseAgent):
     async def _prepare_tools(self) -> Type[NextStepToolStub]:
         """Prepare tool classes with current context limits."""
         tools = set(self.toolkit)
-        if self._context.iteration >= self.max_iterations:
+        if self._context.iteration >= self.max_iterations or self._token_budget_exhausted():
             tools = {
                 CreateReportTool,
                 FinalAnswerTool,
@@ -64,11 +64,14 @@ class SGRAgent(BaseAgent):
             messages=await self._prepare_context(),
             max_tokens=self.llm_config.max_tokens,
             temperature=self.llm_config.temperature,
+            stream_options={"include_usage": True},
         ) as stream:
             async for event in stream:
                 if event.type == "chunk":
                     self.streaming_generator.add_chunk(event.chunk)
-        reasoning: NextStepToolStub = (await stream.get_final_completion()).choices[0].message.parsed  # type: ignore
+        completion = await stream.get_final_completion()
+        self._accumulate_tokens(completion.usage, "reasoning")
+        reasoning: NextStepToolStub = completion.choices[0].message.parsed  # type: ignore
         # we are not fully sure if it should be in conversation or not. Looks like not necessary data
         # self.conversation.append({"role": "assistant", "content": reasoning.model_dump_json(exclude={"function"})})
         self._log_reasoning(reasoning)
@@ -44,26 +44,30 @@ class SGRSOToolCallingAgent(SGRToolCallingAgent):
             messages=await self._prepare_context(),
             max_tokens=self.llm_config.max_tokens,
             temperature=self.llm_config.temperature,
+            stream_options={"include_usage": True},
             tools=await self._prepare_tools(),
             tool_choice={"type": "function", "function": {"name": ReasoningTool.tool_name}},
         ) as stream:
             async for event in stream:
                 if event.type == "chunk":
                     self.streaming_generator.add_chunk(event.chunk)
-            reasoning: ReasoningTool = (  # noqa
-                (await stream.get_final_completion()).choices[0].message.tool_calls[0].function.parsed_arguments  #
-            )
+            completion = await stream.get_final_completion()
+            self._accumulate_tokens(completion.usage, "reasoning")
+            reasoning: ReasoningTool = completion.choices[0].message.tool_calls[0].function.parsed_arguments  # noqa
         async with self.openai_client.chat.completions.stream(
             model=self.llm_config.model,
             response_format=ReasoningTool,
             messages=await self._prepare_context(),
             max_tokens=self.llm_config.max_tokens,
             temperature=self.llm_config.temperature,
+            stream_options={"include_usage": True},
         ) as stream:
             async for event in stream:
                 if event.type == "chunk":
                     self.streaming_generator.add_chunk(event.chunk)
-        reasoning: ReasoningTool = (await stream.get_final_completion()).choices[0].message.parsed
+        completion = await stream.get_final_completion()
+        self._accumulate_tokens(completion.usage, "reasoning")
+        reasoning: ReasoningTool = completion.choices[0].message.parsed
         tool_call_result = await reasoning(self._context)
         self.conversation.append(
             {
@@ -1,6 +1,6 @@
 from typing import Literal, Type
 
-from openai import AsyncOpenAI, pydantic_function_tool
+from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionFunctionToolParam
 
 from sgr_deep_research.core.agent_definition import ExecutionConfig, LLMConfig, PromptsConfig
@@ -11,6 +11,9 @@ from sgr_deep_research.core.tools import (
     ClarificationTool,
     CreateReportTool,
     FinalAnswerTool,
+    FunctionToolsBuilder,
+    NextStepToolsBuilder,
+    NextStepToolStub,
     ReasoningTool,
     WebSearchTool,
 )
@@ -41,11 +44,12 @@ class SGRToolCallingAgent(SGRAgent):
         )
         self.toolkit.append(ReasoningTool)
         self.tool_choice: Literal["required"] = "required"
+        self.fused_reasoning = execution_config.fused_reasoning
 
-    async def _prepare_tools(self) -> list[ChatCompletionFunctionToolParam]:
-        """Prepare available tools for current agent state and progress."""
+    def _available_tools(self) -> set[Type[BaseTool]]:
+        """Tool classes available for current agent state and progress."""
         tools = set(self.toolkit)
-        if self._context.iteration >= self.max_iterations:
+        if self._context.iteration >= self.max_iterations or self._token_budget_exhausted():
             tools = {
                 ReasoningTool,
                 CreateReportTool,
@@ -59,23 +63,13 @@ class SGRToolCallingAgent(SGRAgent):
             tools -= {
                 WebSearchTool,
             }
-        return [pydantic_function_tool(tool, name=tool.tool_name, description="") for tool in tools]
+        return tools
 
-    async def _reasoning_phase(self) -> ReasoningTool:
-        async with self.openai_client.chat.completions.stream(
-            model=self.llm_config.model,
-            messages=await self._prepare_context(),
-            max_tokens=self.llm_config.max_tokens,
-            temperature=self.llm_config.temperature,
-            tools=await self._prepare_tools(),
-            tool_choice={"type": "function", "function": {"name": ReasoningTool.tool_name}},
-        ) as stream:
-            async for event in stream:
-                if event.type == "chunk":
-                    self.streaming_generator.add_chunk(event.chunk)
-            reasoning: ReasoningTool = (
-                (await stream.get_final_completion()).choices[0].message.tool_calls[0].function.parsed_arguments
-            )
+    async def _prepare_tools(self) -> list[ChatCompletionFunctionToolParam]:
+        """Prepare available tools for current agent state and progress."""
+        return FunctionToolsBuilder.build_function_tools(self._available_tools())
+
+    def _add_reasoning_to_conversation(self, reasoning: ReasoningTool, tool_call_result: str) -> None:
         self.conversation.append(
             {
                 "role": "assistant",
@@ -92,39 +86,101 @@ class SGRToolCallingAgent(SGRAgent):
                 ],
             }
         )
-        tool_call_result = await reasoning(self._context)
         self.conversation.append(
             {"role": "tool", "content": tool_call_result, "tool_call_id": f"{self._context.iteration}-reasoning"}
         )
+
+    async def _fused_reasoning_phase(self) -> NextStepToolStub:
+        """Produce reasoning and next action in a single LLM call.
+
+        The reasoning schema is extended with a union of available tools, so
+        the step needs one round trip instead of two. The conversation gets
+        the same reasoning and action messages as in the two-call mode.
+        """
+        next_step_tools = NextStepToolsBuilder.build_NextStepTools(list(self._available_tools() - {ReasoningTool}))
+        async with self.openai_client.chat.completions.stream(
+            model=self.llm_config.model,
+            messages=await self._prepare_context(),
+            max_tokens=self.llm_config.max_tokens,
+            temperature=self.llm_config.temperature,
+            stream_options={"include_usage": True},
+            tools=FunctionToolsBuilder.build_function_tools([next_step_tools]),
+            tool_choice={"type": "function", "function": {"name": next_step_tools.tool_name}},
+        ) as stream:
+            async for event in stream:
+                if event.type == "chunk":
+                    self.streaming_generator.add_chunk(event.chunk)
+            completion = await stream.get_final_completion()
+            self._accumulate_tokens(completion.usage, "reasoning")
+            next_step: NextStepToolStub = completion.choices[0].message.tool_calls[0].function.parsed_arguments
+        reasoning = ReasoningTool(**next_step.model_dump(exclude={"function"}))
+        self._add_reasoning_to_conversation(reasoning, await reasoning(self._context))
+        self._log_reasoning(next_step)
+        return next_step
+
+    async def _reasoning_phase(self) -> ReasoningTool:
+        if self.fused_reasoning:
+            return await self._fused_reasoning_phase()
+        async with self.openai_client.chat.completions.stream(
+            model=self.llm_config.model,
+            messages=await self._prepare_context(),
+            max_tokens=self.llm_config.max_tokens,
+            temperature=self.llm_config.temperature,
+            stream_options={"include_usage": True},
+            tools=await self._prepare_tools(),
+            tool_choice={"type": "function", "function": {"name": ReasoningTool.tool_name}},
+        ) as stream:
+            async for event in stream:
+                if event.type == "chunk":
+                    self.streaming_generator.add_chunk(event.chunk)
+            completion = await stream.get_final_completion()
+            self._accumulate_tokens(completion.usage, "reasoning")
+            reasoning: ReasoningTool = completion.choices[0].message.tool_calls[0].function.parsed_arguments
+        self._add_reasoning_to_conversation(reasoning, await reasoning(self._context))
         self._log_reasoning(reasoning)
         return reasoning
 
-    async def _select_action_phase(self, reasoning: ReasoningTool) -> BaseTool:
+    async def _select_action_tools(self) -> list[BaseTool]:
+        """Ask LLM to choose tool calls for the action decided in reasoning
+        phase."""
         async with self.openai_client.chat.completions.stream(
             model=self.llm_config.model,
             messages=await self._prepare_context(),
             max_tokens=self.llm_config.max_tokens,
             temperature=self.llm_config.temperature,
+            stream_options={"include_usage": True},
             tools=await self._prepare_tools(),
             tool_choice=self.tool_choice,
+            **({"parallel_tool_calls": True} if self.parallel_tool_calls else {}),
         ) as stream:
             async for event in stream:
                 if event.type == "chunk":
                     self.streaming_generator.add_chunk(event.chunk)
 
         completion = await stream.get_final_completion()
+        self._accumulate_tokens(completion.usage, "select_action")
 
-        try:
-            tool = completion.choices[0].message.tool_calls[0].function.parsed_arguments
-        except (IndexError, AttributeError, TypeError):
+        tool_calls = completion.choices[0].message.tool_calls or []
+        tools = [tool_call.function.parsed_arguments for tool_call in tool_calls]
+        if not tools:
             # LLM returned a text response instead of a tool call - treat as completion
             final_content = completion.choices[0].message.content or "Task completed successfully"
-            tool = FinalAnswerTool(
-                reasoning="Agent decided to complete the task",
-                completed_steps=[final_content],
-                status=AgentStatesEnum.COMPLETED,
-            )
-        if not isinstance(tool, BaseTool):
+            tools = [
+                FinalAnswerTool(
+                    reasoning="Agent decided to complete the task",
+                    completed_steps=[final_content],
+                    status=AgentStatesEnum.COMPLETED,
+                )
+            ]
+        return tools
+
+    async def _select_action_phase(self, reasoning: ReasoningTool) -> list[BaseTool]:
+        if isinstance(reasoning, NextStepToolStub):
+            tools = [reasoning.function]
+        else:
+            tools = await self._select_action_tools()
+        tools = self._limit_parallel_tools(tools)
+        if not all(isinstance(tool, BaseTool) for tool in tools):
             raise ValueError("Selected tool is not a valid BaseTool instance")
         self.conversation.append(
             {
@@ -133,16 +189,19 @@ class SGRToolCallingAgent(SGRAgent):
                 "tool_calls": [
                     {
                         "type": "function",
-                        "id": f"{self._context.iteration}-action",
+                        "id": self._action_tool_call_id(i),
                         "function": {
                             "name": tool.tool_name,
                             "arguments": tool.model_dump_json(),
                         },
                     }
+                    for i, tool in enumerate(tools)
                 ],
             }
         )
-        self.streaming_generator.add_tool_call(
-            f"{self._context.iteration}-action", tool.tool_name, tool.model_dump_json()
-        )
-        return tool
+        for i, tool in enumerate(tools):
+            self.streaming_generator.add_tool_call(self._action_tool_call_id(i), tool.tool_name, tool.model_dump_json())
+        return tools
+
+    async def _action_phase(self, tools: list[BaseTool]) -> list[str]:
+        return await self._run_tools(tools)
@@ -1,6 +1,6 @@
 from typing import Literal, Type
 
-from openai import AsyncOpenAI, pydantic_function_tool
+from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionFunctionToolParam
 
 from sgr_deep_research.core.agent_definition import ExecutionConfig, LLMConfig, PromptsConfig
@@ -10,6 +10,7 @@ from sgr_deep_research.core.tools import (
     ClarificationTool,
     CreateReportTool,
     FinalAnswerTool,
+    FunctionToolsBuilder,
     WebSearchTool,
 )
 
@@ -43,7 +44,7 @@ class ToolCallingAgent(BaseAgent):
     async def _prepare_tools(self) -> list[ChatCompletionFunctionToolParam]:
         """Prepare tool classes with current context limits."""
         tools = set(self.toolkit)
-        if self._context.iteration >= self.max_iterations:
+        if self._context.iteration >= self.max_iterations or self._token_budget_exhausted():
             tools = {
                 CreateReportTool,
                 FinalAnswerTool,
@@ -56,27 +57,32 @@ class ToolCallingAgent(BaseAgent):
             tools -= {
                 WebSearchTool,
             }
-        return [pydantic_function_tool(tool, name=tool.tool_name, description="") for tool in tools]
+        return FunctionToolsBuilder.build_function_tools(tools)
 
     async def _reasoning_phase(self) -> None:
         """No explicit reasoning phase, reasoning is done internally by LLM."""
         return None
 
-    async def _select_action_phase(self, reasoning=None) -> BaseTool:
+    async def _select_action_phase(self, reasoning=None) -> list[BaseTool]:
         async with self.openai_client.chat.completions.stream(
             model=self.llm_config.model,
             messages=await self._prepare_context(),
             max_tokens=self.llm_config.max_tokens,
             temperature=self.llm_config.temperature,
+            stream_options={"include_usage": True},
             tools=await self._prepare_tools(),
             tool_choice=self.tool_choice,
+            **({"parallel_tool_calls": True} if self.parallel_tool_calls else {}),
         ) as stream:
             async for event in stream:
                 if event.type == "chunk":
                     self.streaming_generator.add_chunk(event.chunk)
-        tool = (await stream.get_final_completion()).choices[0].message.tool_calls[0].function.parsed_arguments
+        completion = await stream.get_final_completion()
+        self._accumulate_tokens(completion.usage, "select_action")
+        tool_calls = completion.choices[0].message.tool_calls or []
+        tools = self._limit_parallel_tools([tool_call.function.parsed_arguments for tool_call in tool_calls])
 
-        if not isinstance(tool, BaseTool):
+        if not tools or not all(isinstance(tool, BaseTool) for tool in tools):
             raise ValueError("Selected tool is not a valid BaseTool instance")
         self.conversation.append(
             {
@@ -85,25 +91,19 @@ class ToolCallingAgent(BaseAgent):
                 "tool_calls": [
                     {
                         "type": "function",
-                        "id": f"{self._context.iteration}-action",
+                        "id": self._action_tool_call_id(i),
                         "function": {
                             "name": tool.tool_name,
                             "arguments": tool.model_dump_json(),
                         },
                     }
+                    for i, tool in enumerate(tools)
                 ],
             }
         )
-        self.streaming_generator.add_tool_call(
-            f"{self._context.iteration}-action", tool.tool_name, tool.model_dump_json()
-        )
-        return tool
+        for i, tool in enumerate(tools):
+            self.streaming_generator.add_tool_call(self._action_tool_call_id(i), tool.tool_name, tool.model_dump_json())
+        return tools
 
-    async def _action_phase(self, tool: BaseTool) -> str:
-        result = await tool(self._context)
-        self.conversation.append(
-            {"role": "tool", "content": result, "tool_call_id": f"{self._context.iteration}-action"}
-        )
-        self.streaming_generator.add_chunk_from_str(f"{result}\n")
-        self._log_tool_execution(tool, result)
-        return result
+    async def _action_phase(self, tools: list[BaseTool]) -> list[str]:
+        return await self._run_tools(tools)
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import os
@@ -10,7 +11,9 @@ from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionFunctionToolParam
 
 from sgr_deep_research.core.agent_definition import ExecutionConfig, LLMConfig, PromptsConfig
-from sgr_deep_research.core.models import AgentStatesEnum, ResearchContext
+from sgr_deep_research.core.models import AgentStatesEnum, ResearchContext, TokenUsage
+from sgr_deep_research.core.services.agent_store import AgentSnapshot
+from sgr_deep_research.core.services.context_compaction import ContextCompactor, SummarizingContextCompactor
 from sgr_deep_research.core.services.prompt_loader import PromptLoader
 from sgr_deep_research.core.services.registry import AgentRegistry
 from sgr_deep_research.core.stream import OpenAIStreamingGenerator
@@ -18,6 +21,7 @@ from sgr_deep_research.core.tools import (
     BaseTool,
     ClarificationTool,
     ReasoningTool,
+    WebSearchTool,
 )
 
 
@@ -54,13 +58,36 @@ class BaseAgent(AgentRegistryMixin):
         self.log = []
         self.max_iterations = execution_config.max_iterations
         self.max_clarifications = execution_config.max_clarifications
+        self.max_searches = execution_config.max_searches
+        self.parallel_tool_calls = execution_config.parallel_tool_calls
+        self.max_parallel_tool_calls = execution_config.max_parallel_tool_calls
+        self.token_budget = execution_config.token_budget
+        self.token_budget_reserve = execution_config.token_budget_reserve
 
         self.openai_client = openai_client
         self.llm_config = llm_config
         self.prompts_config = prompts_config
 
+        self.context_compactor = self._create_context_compactor(execution_config)
+
         self.streaming_generator = OpenAIStreamingGenerator(model=self.id)
 
+    def _create_context_compactor(self, execution_config: ExecutionConfig) -> ContextCompactor | None:
+        """Create compactor bounding conversation growth, override to plug in
+        another compaction strategy."""
+        if not execution_config.compaction_threshold_tokens:
+            return None
+        params = dict(
+            threshold_tokens=execution_config.compaction_threshold_tokens,
+            keep_last=execution_config.compaction_keep_last,
+            stub_chars=execution_config.compaction_stub_chars,
+        )
+        if execution_config.compaction_model:
+            return SummarizingContextCompactor(
+                openai_client=self.openai_client, model=execution_config.compaction_model, **params
+            )
+        return ContextCompactor(**params)
+
     async def provide_clarification(self, clarifications: str):
         """Receive clarification from external source (e.g. user input)"""
         self.conversation.append(
@@ -71,6 +98,29 @@ class BaseAgent(AgentRegistryMixin):
         self._context.state = AgentStatesEnum.RESEARCHING
         self.logger.info(f"✅ Clarification received: {clarifications[:2000]}...")
 
+    def snapshot(self) -> AgentSnapshot:
+        """Compact serializable agent state."""
+        return AgentSnapshot.from_agent(self)
+
+    def _accumulate_tokens(self, usage, phase: str) -> None:
+        """Store token usage reported by the LLM response in total and per
+        agent phase."""
+        if usage is None:
+            return
+        self._context.token_usage.add(usage)
+        self._context.phase_token_usage.setdefault(phase, TokenUsage()).add(usage)
+        self.logger.debug(
+            f"💾 {phase}: {usage.prompt_tokens} prompt tokens ({self._context.token_usage.cached_tokens} cached "
+            f"in total), {usage.completion_tokens} completion tokens"
+        )
+
+    def _token_budget_exhausted(self) -> bool:
+        """Whether the token budget is nearly spent and the agent must
+        finish."""
+        if not self.token_budget:
+            return False
+        return self._context.token_usage.total_tokens >= self.token_budget - self.token_budget_reserve
+
     def _log_reasoning(self, result: ReasoningTool) -> None:
         next_step = result.remaining_steps[0] if result.remaining_steps else "Completing"
         self.logger.info(
@@ -129,13 +179,53 @@ class BaseAgent(AgentRegistryMixin):
             "model_config": self.llm_config.model_dump(exclude={"api_key", "proxy"}),
             "task": self.task,
             "toolkit": [tool.tool_name for tool in self.toolkit],
+            "usage": self._context.token_usage.model_dump(),
+            "phase_usage": {phase: usage.model_dump() for phase, usage in self._context.phase_token_usage.items()},
             "log": self.log,
         }
 
         json.dump(agent_log, open(filepath, "w", encoding="utf-8"), indent=2, ensure_ascii=False)
 
+    def _action_tool_call_id(self, index: int = 0) -> str:
+        suffix = f"-{index}" if index else ""
+        return f"{self._context.iteration}-action{suffix}"
+
+    def _limit_parallel_tools(self, tools: list[BaseTool]) -> list[BaseTool]:
+        """Keep tool calls allowed to run in one step.
+
+        Only the first call is used unless parallel tool calls are enabled,
+        and parallel searches can't exceed the remaining search budget.
+        """
+        if not self.parallel_tool_calls:
+            return tools[:1]
+        searches_left = self.max_searches - self._context.searches_used
+        limited_tools = []
+        for tool in tools[: self.max_parallel_tool_calls]:
+            if isinstance(tool, WebSearchTool):
+                if searches_left <= 0:
+                    continue
+                searches_left -= 1
+            limited_tools.append(tool)
+        return limited_tools or tools[:1]
+
+    async def _run_tools(self, tools: list[BaseTool]) -> list[str]:
+        """Execute tools of one step concurrently and append all results to
+        the conversation in call order."""
+        results = await asyncio.gather(*(tool(self._context) for tool in tools))
+        self.conversation.extend(
+            {"role": "tool", "content": result, "tool_call_id": self._action_tool_call_id(i)}
+            for i, result in enumerate(results)
+        )
+        for tool, result in zip(tools, results):
+            self.streaming_generator.add_chunk_from_str(f"{result}\n")
+            self._log_tool_execution(tool, result)
+        return list(results)
+
     async def _prepare_context(self) -> list[dict]:
-        """Prepare conversation context with system prompt."""
+        """Prepare conversation context with system prompt, compacting old
+        tool results when the conversation grows too large."""
+        if self.context_compactor is not None:
+            await self.context_compactor.compact(self.conversation)
         return [
             {"role": "system", "content": PromptLoader.get_system_prompt(self.toolkit, self.prompts_config)},
             *self.conversation,
@@ -149,17 +239,19 @@ class BaseAgent(AgentRegistryMixin):
         """Call LLM to decide next action based on current context."""
         raise NotImplementedError("_reasoning_phase must be implemented by subclass")
 
-    async def _select_action_phase(self, reasoning: ReasoningTool) -> BaseTool:
+    async def _select_action_phase(self, reasoning: ReasoningTool) -> BaseTool | list[BaseTool]:
         """Select most suitable tool for the action decided in reasoning phase.
 
-        Returns the tool suitable for the action.
+        Returns the tool suitable for the action, or several tools to run
+        concurrently when the agent supports parallel tool calls.
         """
         raise NotImplementedError("_select_action_phase must be implemented by subclass")
 
-    async def _action_phase(self, tool: BaseTool) -> str:
+    async def _action_phase(self, tool: BaseTool | list[BaseTool]) -> str | list[str]:
         """Call Tool for the action decided in select_action phase.
 
-        Returns string or dumped json result of the tool execution.
+        Returns string or dumped json result of the tool execution, one per
+        tool when several tools were selected.
         """
         raise NotImplementedError("_action_phase must be implemented by subclass")
 
@@ -185,10 +277,11 @@ class BaseAgent(AgentRegistryMixin):
                 action_tool = await self._select_action_phase(reasoning)
                 await self._action_phase(action_tool)
 
-                if isinstance(action_tool, ClarificationTool):
+                action_tools = action_tool if isinstance(action_tool, list) else [action_tool]
+                if any(isinstance(tool, ClarificationTool) for tool in action_tools):
                     self.logger.info("\n⏸️  Research paused - please answer questions")
                     self._context.state = AgentStatesEnum.WAITING_FOR_CLARIFICATION
-                    self.streaming_generator.finish()
+                    self.streaming_generator.finish(usage=self._context.token_usage.to_openai())
                     self._context.clarification_received.clear()
                     await self._context.clarification_received.wait()
                     continue
@@ -199,5 +292,5 @@ class BaseAgent(AgentRegistryMixin):
             traceback.print_exc()
         finally:
             if self.streaming_generator is not None:
-                self.streaming_generator.finish()
+                self.streaming_generator.finish(usage=self._context.token_usage.to_openai())
             self._save_agent_log()
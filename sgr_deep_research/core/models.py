@@ -3,7 +3,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 
 class SourceData(BaseModel):
@@ -32,6 +32,35 @@ class SearchResult(BaseModel):
         return f"Search: '{self.query}' ({len(self.citations)} sources)"
 
 
+class TokenUsage(BaseModel):
+    """LLM token usage, accumulated over one or more completions."""
+
+    prompt_tokens: int = Field(default=0, description="Prompt tokens")
+    completion_tokens: int = Field(default=0, description="Completion tokens")
+    cached_tokens: int = Field(default=0, description="Prompt tokens served from provider prefix cache")
+
+    @computed_field
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def add(self, usage: Any) -> None:
+        """Add usage reported by an OpenAI-compatible completion."""
+        details = getattr(usage, "prompt_tokens_details", None)
+        self.prompt_tokens += getattr(usage, "prompt_tokens", None) or 0
+        self.completion_tokens += getattr(usage, "completion_tokens", None) or 0
+        self.cached_tokens += getattr(details, "cached_tokens", None) or 0
+
+    def to_openai(self) -> dict:
+        """Usage in OpenAI chat completion format."""
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "prompt_tokens_details": {"cached_tokens": self.cached_tokens},
+        }
+
+
 class AgentStatesEnum(str, Enum):
     INITED = "inited"
     RESEARCHING = "researching"
@@ -57,11 +86,29 @@ class ResearchContext(BaseModel):
 
     searches_used: int = Field(default=0, description="Number of searches performed")
 
+    token_usage: TokenUsage = Field(default_factory=TokenUsage, description="Total LLM token usage")
+    phase_token_usage: dict[str, TokenUsage] = Field(
+        default_factory=dict, description="LLM token usage per agent phase"
+    )
+
     clarifications_used: int = Field(default=0, description="Number of clarifications requested")
     clarification_received: asyncio.Event = Field(
         default_factory=asyncio.Event, description="Event for clarification synchronization"
     )
 
+    def add_source(self, source: SourceData) -> SourceData:
+        """Register source under a stable citation number.
+
+        Known URLs keep their number, new URLs get the next free one, so
+        numbering stays unique when several tools add sources concurrently.
+        """
+        existing = self.sources.get(source.url)
+        if existing is not None:
+            return existing
+        source.number = max((s.number for s in self.sources.values()), default=0) + 1
+        self.sources[source.url] = source
+        return source
+
     def agent_state(self) -> dict:
         return self.model_dump(exclude={"searches", "sources", "clarification_received"})
 
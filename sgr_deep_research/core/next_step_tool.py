@@ -4,8 +4,10 @@ import logging
 import operator
 from abc import ABC
 from functools import reduce
-from typing import Annotated, Literal, Type, TypeVar
+from typing import Annotated, ClassVar, Iterable, Literal, Type, TypeVar
 
+from openai import pydantic_function_tool
+from openai.types.chat import ChatCompletionFunctionToolParam
 from pydantic import BaseModel, Field, create_model
 
 from sgr_deep_research.core.base_tool import BaseTool
@@ -33,9 +35,19 @@ class DiscriminantToolMixin(BaseModel):
         return super().model_dump(*args, exclude=exclude, **kwargs)
 
 
+def sorted_tools(tools: Iterable[Type[T]]) -> list[Type[T]]:
+    """Deterministic tool order, independent of set iteration order."""
+    return sorted(set(tools), key=lambda tool: (tool.tool_name, tool.__module__, tool.__qualname__))
+
+
 class NextStepToolsBuilder:
     """SGR Core - Builder for NextStepTool with a dynamic union tool function type on
-    pydantic models level."""
+    pydantic models level.
+
+    Built models are memoized per set of tools, so schema generation happens once per process.
+    """
+
+    _cache: ClassVar[dict[frozenset, Type[NextStepToolStub]]] = {}
 
     @classmethod
     def _create_discriminant_tool(cls, tool_class: Type[T]) -> Type[BaseModel]:
@@ -60,8 +72,27 @@ class NextStepToolsBuilder:
 
     @classmethod
     def build_NextStepTools(cls, tools_list: list[Type[T]]) -> Type[NextStepToolStub]:  # noqa
-        return create_model(
-            "NextStepTools",
-            __base__=NextStepToolStub,
-            function=(cls._create_tool_types_union(tools_list), Field()),
-        )
+        key = frozenset(tools_list)
+        if key not in cls._cache:
+            cls._cache[key] = create_model(
+                "NextStepTools",
+                __base__=NextStepToolStub,
+                function=(cls._create_tool_types_union(sorted_tools(tools_list)), Field()),
+            )
+        return cls._cache[key]
+
+
+class FunctionToolsBuilder:
+    """Builder for native function calling tool params, memoized per set of
+    tools and returned in deterministic order."""
+
+    _cache: ClassVar[dict[frozenset, list[ChatCompletionFunctionToolParam]]] = {}
+
+    @classmethod
+    def build_function_tools(cls, tools_list: Iterable[Type[T]]) -> list[ChatCompletionFunctionToolParam]:
+        key = frozenset(tools_list)
+        if key not in cls._cache:
+            cls._cache[key] = [
+                pydantic_function_tool(tool, name=tool.tool_name, description="") for tool in sorted_tools(key)
+            ]
+        return list(cls._cache[key])
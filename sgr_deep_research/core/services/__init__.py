@@ -1,5 +1,16 @@
 """Services module for external integrations and business logic."""
 
+from sgr_deep_research.core.services.agent_scheduler import AgentQueueFullError, AgentScheduler
+from sgr_deep_research.core.services.agent_store import (
+    AgentSnapshot,
+    AgentSnapshotBackend,
+    AgentStore,
+    SQLiteAgentSnapshotBackend,
+)
+from sgr_deep_research.core.services.agent_workers import AgentWorkerPool, RemoteAgent
+from sgr_deep_research.core.services.cache import TTLCache
+from sgr_deep_research.core.services.client_pool import LLMClientPool
+from sgr_deep_research.core.services.context_compaction import ContextCompactor, SummarizingContextCompactor
 from sgr_deep_research.core.services.prompt_loader import PromptLoader
 from sgr_deep_research.core.services.registry import AgentRegistry, ToolRegistry
 from sgr_deep_research.core.services.tavily_search import TavilySearchService
@@ -10,4 +21,16 @@ __all__ = [
     "ToolRegistry",
     "AgentRegistry",
     "PromptLoader",
+    "LLMClientPool",
+    "TTLCache",
+    "ContextCompactor",
+    "SummarizingContextCompactor",
+    "AgentStore",
+    "AgentSnapshot",
+    "AgentSnapshotBackend",
+    "SQLiteAgentSnapshotBackend",
+    "AgentScheduler",
+    "AgentQueueFullError",
+    "AgentWorkerPool",
+    "RemoteAgent",
 ]
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from sgr_deep_research.core.agent_definition import SchedulerConfig
+    from sgr_deep_research.core.base_agent import BaseAgent
+
+logger = logging.getLogger(__name__)
+
+
+class AgentQueueFullError(Exception):
+    """Raised when an agent can't be admitted because the waiting queue is
+    full."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Agent queue is full, retry after {retry_after} seconds")
+        self.retry_after = retry_after
+
+
+class QueuedAgent(NamedTuple):
+    agent: "BaseAgent"
+    definition_name: str
+
+
+class AgentScheduler:
+    """Admission control for agent executions.
+
+    At most ``max_running_agents`` agents execute at once, and at most
+    ``definition_limits[name]`` of them per agent definition. Other agents
+    wait in a FIFO queue of ``max_queued_agents`` and get their queue
+    position streamed to the client. Submitting to a full queue raises
+    AgentQueueFullError. References to running tasks are kept until they
+    finish.
+    """
+
+    def __init__(self, config: "SchedulerConfig | None" = None):
+        self._config = config
+        self._queue: list[QueuedAgent] = []
+        self._running: dict[str, asyncio.Task] = {}
+        self._running_per_definition: dict[str, int] = defaultdict(int)
+
+    @property
+    def config(self) -> "SchedulerConfig":
+        if self._config is None:
+            from sgr_deep_research.core.agent_config import GlobalConfig
+
+            self._config = GlobalConfig().scheduler
+        return self._config
+
+    @property
+    def running_count(self) -> int:
+        return len(self._running)
+
+    @property
+    def queued_count(self) -> int:
+        return len(self._queue)
+
+    def queue_position(self, agent_id: str) -> int | None:
+        """1-based position of the agent in waiting queue, None if not
+        queued."""
+        for position, queued in enumerate(self._queue, start=1):
+            if queued.agent.id == agent_id:
+                return position
+        return None
+
+    def _can_start(self, definition_name: str) -> bool:
+        if len(self._running) >= self.config.max_running_agents:
+            return False
+        limit = self.config.definition_limits.get(definition_name)
+        return limit is None or self._running_per_definition[definition_name] < limit
+
+    def submit(self, agent: "BaseAgent", definition_name: str) -> int:
+        """Start agent execution or put it in the waiting queue.
+
+        Returns:
+            Queue position, 0 if the agent started right away
+
+        Raises:
+            AgentQueueFullError: If the agent has to wait and the queue is full
+        """
+        queued = QueuedAgent(agent, definition_name)
+        self._queue.append(queued)
+        self._dispatch()
+        position = self.queue_position(agent.id)
+        if position is None:
+            return 0
+        if len(self._queue) > self.config.max_queued_agents:
+            self._queue.remove(queued)
+            raise AgentQueueFullError(retry_after=self.config.retry_after)
+        agent.streaming_generator.add_chunk_from_str(f"⏳ Waiting in queue, position {position}\n")
+        logger.info(f"Agent {agent.id} queued at position {position}")
+        return position
+
+    def _start(self, queued: QueuedAgent) -> None:
+        task = asyncio.create_task(queued.agent.execute())
+        self._running[queued.agent.id] = task
+        self._running_per_definition[queued.definition_name] += 1
+        task.add_done_callback(lambda _: self._on_finished(queued))
+
+    def _on_finished(self, queued: QueuedAgent) -> None:
+        self._running.pop(queued.agent.id, None)
+        self._running_per_definition[queued.definition_name] -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Start queued agents that fit the limits in FIFO order, and notify
+        agents left waiting about their new queue position."""
+        old_positions = {queued.agent.id: position for position, queued in enumerate(self._queue, start=1)}
+        for queued in list(self._queue):
+            if self._can_start(queued.definition_name):
+                self._queue.remove(queued)
+                self._start(queued)
+        for position, queued in enumerate(self._queue, start=1):
+            if position < old_positions[queued.agent.id]:
+                queued.agent.streaming_generator.add_chunk_from_str(f"⏳ Waiting in queue, position {position}\n")
+
+    async def cancel_all(self) -> None:
+        """Drop waiting agents and cancel running ones."""
+        self._queue.clear()
+        tasks = list(self._running.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,303 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Iterator
+
+from pydantic import BaseModel, Field
+
+from sgr_deep_research.core.models import AgentStatesEnum, TokenUsage
+
+if TYPE_CHECKING:
+    from sgr_deep_research.core.agent_definition import AgentStoreConfig
+    from sgr_deep_research.core.base_agent import BaseAgent
+
+logger = logging.getLogger(__name__)
+
+
+class AgentSnapshot(BaseModel):
+    """Compact agent state kept after the live agent is evicted from
+    memory."""
+
+    agent_id: str = Field(description="Agent ID")
+    task: str = Field(description="Agent task")
+    state: AgentStatesEnum = Field(description="Agent state")
+    creation_time: datetime = Field(description="Agent creation time")
+    iteration: int = Field(default=0, description="Iterations done")
+    searches_used: int = Field(default=0, description="Number of searches performed")
+    clarifications_used: int = Field(default=0, description="Number of clarifications requested")
+    sources_count: int = Field(default=0, description="Number of sources found")
+    current_step_reasoning: dict[str, Any] | None = Field(default=None, description="Last agent step")
+    execution_result: str | None = Field(default=None, description="Execution result")
+    token_usage: TokenUsage = Field(default_factory=TokenUsage, description="Total LLM token usage")
+    phase_token_usage: dict[str, TokenUsage] = Field(default_factory=dict, description="Token usage per phase")
+
+    @classmethod
+    def from_agent(cls, agent: "BaseAgent") -> "AgentSnapshot":
+        context = agent._context.model_dump(include={"current_step_reasoning"})
+        return cls(
+            agent_id=agent.id,
+            task=agent.task,
+            state=agent._context.state,
+            creation_time=agent.creation_time,
+            iteration=agent._context.iteration,
+            searches_used=agent._context.searches_used,
+            clarifications_used=agent._context.clarifications_used,
+            sources_count=len(agent._context.sources),
+            current_step_reasoning=context["current_step_reasoning"],
+            execution_result=agent._context.execution_result,
+            token_usage=agent._context.token_usage,
+            phase_token_usage=agent._context.phase_token_usage,
+        )
+
+
+def estimate_agent_memory(agent: "BaseAgent") -> int:
+    """Rough size of the agent's largest buffers in bytes: conversation and
+    collected sources."""
+    size = 0
+    for message in agent.conversation:
+        size += len(message.get("content") or "")
+        for tool_call in message.get("tool_calls") or []:
+            size += len(tool_call["function"]["arguments"] or "")
+    for source in agent._context.sources.values():
+        size += len(source.full_content) + len(source.snippet)
+    return size
+
+
+class AgentSnapshotBackend:
+    """Storage for snapshots of evicted agents, in memory by default."""
+
+    def __init__(self, ttl: float, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._snapshots: OrderedDict[str, tuple[AgentSnapshot, float]] = OrderedDict()
+
+    async def save(self, snapshot: AgentSnapshot) -> None:
+        self._snapshots.pop(snapshot.agent_id, None)
+        self._snapshots[snapshot.agent_id] = (snapshot, time.time() + self.ttl)
+        while len(self._snapshots) > self.max_entries:
+            self._snapshots.popitem(last=False)
+
+    async def load(self, agent_id: str) -> AgentSnapshot | None:
+        snapshot, expires_at = self._snapshots.get(agent_id, (None, 0.0))
+        if snapshot is not None and expires_at <= time.time():
+            del self._snapshots[agent_id]
+            return None
+        return snapshot
+
+    async def list(self) -> list[AgentSnapshot]:
+        now = time.time()
+        for agent_id in [agent_id for agent_id, (_, expires_at) in self._snapshots.items() if expires_at <= now]:
+            del self._snapshots[agent_id]
+        return [snapshot for snapshot, _ in self._snapshots.values()]
+
+    async def clear(self) -> None:
+        self._snapshots.clear()
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteAgentSnapshotBackend(AgentSnapshotBackend):
+    """Snapshot backend in a SQLite file, so state of finished agents
+    survives restarts."""
+
+    def __init__(self, db_path: str, ttl: float, max_entries: int = 10000):
+        super().__init__(ttl=ttl, max_entries=max_entries)
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db_lock = threading.Lock()
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS agent_snapshots (agent_id TEXT PRIMARY KEY, snapshot TEXT, expires_at REAL)"
+        )
+        self._db.commit()
+
+    def _execute(self, query: str, params: tuple = ()) -> list[tuple]:
+        with self._db_lock:
+            rows = self._db.execute(query, params).fetchall()
+            self._db.commit()
+        return rows
+
+    def _save(self, snapshot: AgentSnapshot) -> None:
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO agent_snapshots VALUES (?, ?, ?)",
+                (snapshot.agent_id, snapshot.model_dump_json(), time.time() + self.ttl),
+            )
+            self._db.execute(
+                "DELETE FROM agent_snapshots WHERE agent_id NOT IN "
+                "(SELECT agent_id FROM agent_snapshots ORDER BY expires_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+            self._db.commit()
+
+    async def save(self, snapshot: AgentSnapshot) -> None:
+        await asyncio.to_thread(self._save, snapshot)
+
+    async def load(self, agent_id: str) -> AgentSnapshot | None:
+        rows = await asyncio.to_thread(
+            self._execute,
+            "SELECT snapshot FROM agent_snapshots WHERE agent_id = ? AND expires_at > ?",
+            (agent_id, time.time()),
+        )
+        return AgentSnapshot.model_validate_json(rows[0][0]) if rows else None
+
+    async def list(self) -> list[AgentSnapshot]:
+        await asyncio.to_thread(self._execute, "DELETE FROM agent_snapshots WHERE expires_at <= ?", (time.time(),))
+        rows = await asyncio.to_thread(self._execute, "SELECT snapshot FROM agent_snapshots ORDER BY expires_at")
+        return [AgentSnapshot.model_validate_json(row[0]) for row in rows]
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._execute, "DELETE FROM agent_snapshots")
+
+    def close(self) -> None:
+        with self._db_lock:
+            self._db.close()
+
+
+class AgentStore:
+    """Bounded store of agents served by the API.
+
+    Live agents are kept in memory in LRU order. Finished agents are evicted
+    ``finished_ttl`` seconds after they finish, or earlier when the store
+    exceeds ``max_agents`` or ``max_memory_bytes``. Only a compact
+    AgentSnapshot of an evicted agent is kept in the snapshot backend, so its
+    state can still be queried. Running agents and agents waiting for
+    clarification are never evicted.
+
+    Supports dict-like access to live agents.
+    """
+
+    def __init__(self, config: "AgentStoreConfig | None" = None, backend: AgentSnapshotBackend | None = None):
+        self._config = config
+        self._backend = backend
+        self._agents: OrderedDict[str, "BaseAgent"] = OrderedDict()
+        self._finished_at: dict[str, float] = {}
+        self.evictions = 0
+
+    @property
+    def config(self) -> "AgentStoreConfig":
+        if self._config is None:
+            from sgr_deep_research.core.agent_config import GlobalConfig
+
+            self._config = GlobalConfig().agent_store
+        return self._config
+
+    @property
+    def backend(self) -> AgentSnapshotBackend:
+        if self._backend is None:
+            if self.config.db_path:
+                self._backend = SQLiteAgentSnapshotBackend(
+                    self.config.db_path, ttl=self.config.snapshot_ttl, max_entries=self.config.max_snapshots
+                )
+            else:
+                self._backend = AgentSnapshotBackend(
+                    ttl=self.config.snapshot_ttl, max_entries=self.config.max_snapshots
+                )
+        return self._backend
+
+    def __setitem__(self, agent_id: str, agent: "BaseAgent") -> None:
+        self._agents[agent_id] = agent
+        self._agents.move_to_end(agent_id)
+
+    def __getitem__(self, agent_id: str) -> "BaseAgent":
+        return self._agents[agent_id]
+
+    def __contains__(self, agent_id: str) -> bool:
+        return agent_id in self._agents
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._agents)
+
+    def get(self, agent_id: str) -> "BaseAgent | None":
+        """Get live agent, marking it as recently used."""
+        agent = self._agents.get(agent_id)
+        if agent is not None:
+            self._agents.move_to_end(agent_id)
+        return agent
+
+    def values(self) -> list["BaseAgent"]:
+        return list(self._agents.values())
+
+    def clear(self) -> None:
+        self._agents.clear()
+        self._finished_at.clear()
+
+    async def add(self, agent: "BaseAgent") -> None:
+        self[agent.id] = agent
+        await self.evict()
+
+    async def get_snapshot(self, agent_id: str) -> AgentSnapshot | None:
+        """State of live agent or of an evicted one."""
+        agent = self.get(agent_id)
+        if agent is not None:
+            return agent.snapshot()
+        return await self.backend.load(agent_id)
+
+    async def list_snapshots(self) -> list[AgentSnapshot]:
+        await self.evict()
+        live = [agent.snapshot() for agent in self._agents.values()]
+        evicted = [snapshot for snapshot in await self.backend.list() if snapshot.agent_id not in self._agents]
+        return evicted + live
+
+    def memory_bytes(self) -> int:
+        return sum(estimate_agent_memory(agent) for agent in self._agents.values())
+
+    def _finished_agent_ids(self) -> list[str]:
+        """Finished agents from least to most recently used."""
+        now = time.time()
+        finished = []
+        for agent_id, agent in self._agents.items():
+            if agent._context.state in AgentStatesEnum.FINISH_STATES.value:
+                self._finished_at.setdefault(agent_id, now)
+                finished.append(agent_id)
+        return finished
+
+    async def _evict_agent(self, agent_id: str) -> None:
+        agent = self._agents.pop(agent_id)
+        self._finished_at.pop(agent_id, None)
+        await self.backend.save(agent.snapshot())
+        self.evictions += 1
+
+    async def evict(self) -> int:
+        """Evict expired finished agents, then least recently used finished
+        agents while the store is over its limits.
+
+        Returns:
+            Number of evicted agents
+        """
+        config = self.config
+        now = time.time()
+        finished = self._finished_agent_ids()
+        expired = [agent_id for agent_id in finished if now - self._finished_at[agent_id] >= config.finished_ttl]
+        for agent_id in expired:
+            await self._evict_agent(agent_id)
+        evicted = len(expired)
+
+        remaining = [agent_id for agent_id in finished if agent_id not in expired]
+        memory_bytes = self.memory_bytes() if remaining and config.max_memory_bytes else 0
+        while remaining and (
+            len(self._agents) > config.max_agents
+            or (config.max_memory_bytes and memory_bytes > config.max_memory_bytes)
+        ):
+            agent_id = remaining.pop(0)
+            memory_bytes -= estimate_agent_memory(self._agents[agent_id])
+            await self._evict_agent(agent_id)
+            evicted += 1
+
+        if evicted:
+            logger.info(f"Evicted {evicted} finished agents, {len(self._agents)} agents left in memory")
+        return evicted
+
+    def close(self) -> None:
+        if self._backend is not None:
+            self._backend.close()
@@ -0,0 +1,302 @@
+import asyncio
+import logging
+import logging.config
+import multiprocessing
+import queue
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import yaml
+
+from sgr_deep_research.core.models import AgentStatesEnum, ResearchContext
+from sgr_deep_research.core.services.agent_store import AgentSnapshot
+from sgr_deep_research.core.stream import OpenAIStreamingGenerator
+
+if TYPE_CHECKING:
+    from sgr_deep_research.core.agent_definition import SchedulerConfig
+    from sgr_deep_research.core.base_agent import BaseAgent
+
+logger = logging.getLogger(__name__)
+
+# Worker -> API state updates are throttled, stream chunks are forwarded as is
+STATE_UPDATE_INTERVAL = 0.5
+# How often the API process checks that worker processes are alive while idle
+WORKER_CHECK_INTERVAL = 1.0
+
+
+class RemoteAgent:
+    """API-side proxy of an agent executed in a worker process.
+
+    Exposes the part of the BaseAgent interface used by the API, agent store
+    and scheduler: stream chunks and state updates are relayed from the
+    worker, clarifications are forwarded to it.
+    """
+
+    def __init__(self, pool: "AgentWorkerPool", definition_name: str, task: str):
+        self.id = f"{definition_name}_{uuid.uuid4()}"
+        self.definition_name = definition_name
+        self.creation_time = datetime.now()
+        self.task = task
+
+        self._context = ResearchContext()
+        self.conversation = []
+        self.streaming_generator = OpenAIStreamingGenerator(model=self.id)
+
+        self._pool = pool
+        self._snapshot = AgentSnapshot(
+            agent_id=self.id, task=task, state=AgentStatesEnum.INITED, creation_time=self.creation_time
+        )
+        self._done = asyncio.Event()
+
+    async def execute(self):
+        self._pool._start(self)
+        try:
+            await self._done.wait()
+        except asyncio.CancelledError:
+            self._pool._send(self.id, ("cancel", self.id, None))
+            raise
+
+    async def provide_clarification(self, clarifications: str):
+        self._context.state = AgentStatesEnum.RESEARCHING
+        self._pool._send(self.id, ("clarify", self.id, clarifications))
+
+    def snapshot(self) -> AgentSnapshot:
+        return self._snapshot
+
+    def _update_state(self, snapshot: dict[str, Any]) -> None:
+        self._snapshot = AgentSnapshot.model_validate(snapshot)
+        self._context.state = self._snapshot.state
+        self._context.iteration = self._snapshot.iteration
+        self._context.searches_used = self._snapshot.searches_used
+        self._context.clarifications_used = self._snapshot.clarifications_used
+        self._context.execution_result = self._snapshot.execution_result
+        self._context.token_usage = self._snapshot.token_usage
+        self._context.phase_token_usage = self._snapshot.phase_token_usage
+
+    def _handle(self, kind: str, payload: Any) -> None:
+        """Apply message relayed from the worker."""
+        if kind == "chunk":
+            self.streaming_generator.queue.put_nowait(payload)
+        elif kind == "state":
+            self._update_state(payload)
+        elif kind == "error":
+            self._update_state({**self._snapshot.model_dump(), "state": AgentStatesEnum.FAILED})
+            self.streaming_generator.add_chunk_from_str(f"❌ Agent execution error: {payload}\n")
+            self.streaming_generator.finish()
+            self._done.set()
+        elif kind == "done":
+            self._update_state(payload)
+            self._done.set()
+
+
+class _AgentWorker:
+    """Executes agents inside a worker process, driven by commands from the
+    API process."""
+
+    def __init__(self, inbox: multiprocessing.Queue, outbox: multiprocessing.Queue):
+        self.inbox = inbox
+        self.outbox = outbox
+        self._agents: dict[str, "BaseAgent"] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._state_sent_at: dict[str, float] = {}
+
+    def _send_state(self, agent: "BaseAgent", kind: str = "state") -> None:
+        self.outbox.put((kind, agent.id, agent.snapshot().model_dump(mode="json")))
+        self._state_sent_at[agent.id] = time.monotonic()
+
+    def _forward(self, agent: "BaseAgent", data: str | None) -> None:
+        self.outbox.put(("chunk", agent.id, data))
+        if data is None or time.monotonic() - self._state_sent_at.get(agent.id, 0.0) >= STATE_UPDATE_INTERVAL:
+            self._send_state(agent)
+
+    async def _relay_stream(self, agent: "BaseAgent") -> None:
+        while True:
+            self._forward(agent, await agent.streaming_generator.queue.get())
+
+    async def _run_agent(self, agent_id: str, definition_name: str, task: str) -> None:
+        from sgr_deep_research.core.agent_config import GlobalConfig
+        from sgr_deep_research.core.agent_factory import AgentFactory
+
+        try:
+            agent_def = GlobalConfig().agents.get(definition_name)
+            if agent_def is None:
+                raise ValueError(f"Agent definition '{definition_name}' not found")
+            agent = await AgentFactory.create(agent_def, task)
+        except Exception as e:
+            logger.error(f"Failed to create agent {agent_id}: {e}")
+            self.outbox.put(("error", agent_id, str(e)))
+            return
+
+        agent.id = agent_id
+        agent.logger = logging.getLogger(f"sgr_deep_research.agents.{agent_id}")
+        agent.streaming_generator = OpenAIStreamingGenerator(model=agent_id)
+        self._agents[agent_id] = agent
+        relay = asyncio.create_task(self._relay_stream(agent))
+        try:
+            await agent.execute()
+        finally:
+            relay.cancel()
+            while not agent.streaming_generator.queue.empty():
+                self._forward(agent, agent.streaming_generator.queue.get_nowait())
+            self._send_state(agent, kind="done")
+            self._agents.pop(agent_id, None)
+            self._state_sent_at.pop(agent_id, None)
+
+    async def run(self) -> None:
+        while True:
+            message = await asyncio.to_thread(self.inbox.get)
+            if message is None:
+                break
+            command, agent_id, payload = message
+            if command == "start":
+                self._tasks[agent_id] = asyncio.create_task(self._run_agent(agent_id, *payload))
+                self._tasks[agent_id].add_done_callback(lambda _, agent_id=agent_id: self._tasks.pop(agent_id, None))
+            elif command == "clarify" and agent_id in self._agents:
+                await self._agents[agent_id].provide_clarification(payload)
+            elif command == "cancel" and agent_id in self._tasks:
+                self._tasks[agent_id].cancel()
+        for task in self._tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+
+def _worker_main(
+    inbox: multiprocessing.Queue,
+    outbox: multiprocessing.Queue,
+    config_file: str,
+    agents_file: str | None,
+    logging_file: str | None,
+) -> None:
+    """Worker process entry point, loads the same configuration as the API
+    process."""
+    from sgr_deep_research.core.agent_config import GlobalConfig
+    from sgr_deep_research.default_definitions import get_default_agents_definitions
+
+    if logging_file and Path(logging_file).exists():
+        logging.config.dictConfig(yaml.safe_load(Path(logging_file).read_text(encoding="utf-8")))
+    config = GlobalConfig.from_yaml(config_file)
+    config.agents.update(get_default_agents_definitions())
+    if agents_file:
+        config.definitions_from_yaml(agents_file)
+    asyncio.run(_AgentWorker(inbox, outbox).run())
+
+
+class AgentWorkerPool:
+    """Pool of processes executing agents outside the API event loop.
+
+    Enabled by ``worker_processes`` in scheduler config. The API process then
+    only routes requests and relays streams: each agent is created and
+    executed in the least loaded worker, its stream chunks and state are sent
+    back over a shared queue and clarifications are sent to the worker owning
+    the agent. Workers load configuration from the same files as the API
+    process. Admission control still happens in the API process.
+    """
+
+    def __init__(self, config: "SchedulerConfig | None" = None):
+        self._config = config
+        self._processes: list[multiprocessing.Process] = []
+        self._inboxes: list[multiprocessing.Queue] = []
+        self._outbox: multiprocessing.Queue | None = None
+        self._agents: dict[str, RemoteAgent] = {}
+        self._agent_workers: dict[str, int] = {}
+        self._relay: asyncio.Task | None = None
+
+    @property
+    def config(self) -> "SchedulerConfig":
+        if self._config is None:
+            from sgr_deep_research.core.agent_config import GlobalConfig
+
+            self._config = GlobalConfig().scheduler
+        return self._config
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.worker_processes > 0
+
+    @property
+    def started(self) -> bool:
+        return self._relay is not None
+
+    def start(self, config_file: str, agents_file: str | None = None, logging_file: str | None = None) -> None:
+        """Spawn ``worker_processes`` workers loading the given configuration
+        files."""
+        context = multiprocessing.get_context("spawn")
+        self._outbox = context.Queue()
+        for _ in range(self.config.worker_processes):
+            inbox = context.Queue()
+            process = context.Process(
+                target=_worker_main,
+                args=(inbox, self._outbox, config_file, agents_file, logging_file),
+                daemon=True,
+            )
+            process.start()
+            self._inboxes.append(inbox)
+            self._processes.append(process)
+        self._relay = asyncio.create_task(self._relay_messages())
+        logger.info(f"Started {len(self._processes)} agent worker processes")
+
+    def create_agent(self, definition_name: str, task: str) -> RemoteAgent:
+        """Create proxy of an agent to be executed in a worker process."""
+        return RemoteAgent(self, definition_name, task)
+
+    def _least_loaded_worker(self) -> int:
+        load = [0] * len(self._inboxes)
+        for worker in self._agent_workers.values():
+            load[worker] += 1
+        return load.index(min(load))
+
+    def _start(self, agent: RemoteAgent) -> None:
+        self._agents[agent.id] = agent
+        self._agent_workers[agent.id] = self._least_loaded_worker()
+        self._send(agent.id, ("start", agent.id, (agent.definition_name, agent.task)))
+
+    def _send(self, agent_id: str, message: tuple) -> None:
+        worker = self._agent_workers.get(agent_id)
+        if worker is not None:
+            self._inboxes[worker].put(message)
+
+    def _dispatch(self, kind: str, agent_id: str, payload: Any) -> None:
+        agent = self._agents.get(agent_id)
+        if agent is None:
+            return
+        agent._handle(kind, payload)
+        if kind in ("done", "error"):
+            self._agents.pop(agent_id, None)
+            self._agent_workers.pop(agent_id, None)
+
+    def _fail_dead_workers(self) -> None:
+        """Fail agents of worker processes that exited unexpectedly."""
+        dead = {worker for worker, process in enumerate(self._processes) if not process.is_alive()}
+        for agent_id, worker in list(self._agent_workers.items()):
+            if worker in dead:
+                self._dispatch("error", agent_id, f"Worker process {self._processes[worker].pid} exited")
+
+    async def _relay_messages(self) -> None:
+        while True:
+            try:
+                message = await asyncio.to_thread(self._outbox.get, timeout=WORKER_CHECK_INTERVAL)
+            except queue.Empty:
+                self._fail_dead_workers()
+                continue
+            if message is None:
+                break
+            self._dispatch(*message)
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        if not self.started:
+            return
+        for inbox in self._inboxes:
+            inbox.put(None)
+        for process in self._processes:
+            await asyncio.to_thread(process.join, timeout)
+            if process.is_alive():
+                process.terminate()
+        self._outbox.put(None)
+        await self._relay
+        self._relay = None
+        self._processes.clear()
+        self._inboxes.clear()
+        logger.info("Stopped agent worker processes")
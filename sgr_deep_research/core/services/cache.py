@@ -0,0 +1,196 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    expires_at: float
+    stale_until: float
+    size: int = 0
+
+
+class CacheStats(BaseModel):
+    hits: int = Field(default=0, description="Fresh hits")
+    stale_hits: int = Field(default=0, description="Hits served stale while revalidating")
+    misses: int = Field(default=0, description="Misses")
+    disk_hits: int = Field(default=0, description="Hits loaded from disk tier")
+    evictions: int = Field(default=0, description="Entries evicted from memory tier")
+
+
+class TTLCache:
+    """Two-tier cache with TTL: in-memory LRU in front of an optional SQLite
+    file that survives restarts.
+
+    Entries are fresh for ``ttl`` seconds and may then be served as stale for
+    another ``stale_ttl`` seconds, letting callers revalidate in background.
+    When ``max_bytes`` is set, both tiers are also bounded by the serialized
+    size of stored values. Values must be JSON serializable.
+    """
+
+    DB_PRUNE_INTERVAL = 100
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        max_entries: int = 1000,
+        stale_ttl: float = 0.0,
+        db_path: str | None = None,
+        max_bytes: int | None = None,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._memory: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._memory_bytes = 0
+        self._db_writes = 0
+        self._db: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        if db_path:
+            self._db = self._open_db(db_path)
+
+    def _open_db(self, db_path: str) -> sqlite3.Connection:
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        db = sqlite3.connect(db_path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "cache_name TEXT, key TEXT, value TEXT, expires_at REAL, stale_until REAL, "
+            "PRIMARY KEY (cache_name, key))"
+        )
+        db.commit()
+        return db
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        self._forget(key)
+        self._memory[key] = entry
+        self._memory_bytes += entry.size
+        while len(self._memory) > self.max_entries or (
+            self.max_bytes is not None and self._memory_bytes > self.max_bytes and len(self._memory) > 1
+        ):
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.size
+            self.stats.evictions += 1
+
+    def _forget(self, key: str) -> None:
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= entry.size
+
+    def _db_get(self, key: str) -> CacheEntry | None:
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT value, expires_at, stale_until FROM cache_entries WHERE cache_name = ? AND key = ?",
+                (self.name, key),
+            ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(value=json.loads(row[0]), expires_at=row[1], stale_until=row[2], size=len(row[0]))
+
+    def _db_set(self, key: str, entry: CacheEntry, serialized: str) -> None:
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?, ?, ?)",
+                (self.name, key, serialized, entry.expires_at, entry.stale_until),
+            )
+            self._db.commit()
+        self._db_writes += 1
+        if self._db_writes % self.DB_PRUNE_INTERVAL == 0:
+            self._db_prune()
+
+    def _db_prune(self) -> None:
+        """Drop expired rows and, if bounded, the oldest rows over
+        max_bytes."""
+        with self._db_lock:
+            self._db.execute(
+                "DELETE FROM cache_entries WHERE cache_name = ? AND stale_until <= ?", (self.name, time.time())
+            )
+            if self.max_bytes is not None:
+                rows = self._db.execute(
+                    "SELECT key, LENGTH(value) FROM cache_entries WHERE cache_name = ? ORDER BY stale_until DESC",
+                    (self.name,),
+                ).fetchall()
+                total, overflow = 0, []
+                for key, size in rows:
+                    total += size
+                    if total > self.max_bytes:
+                        overflow.append((self.name, key))
+                self._db.executemany("DELETE FROM cache_entries WHERE cache_name = ? AND key = ?", overflow)
+            self._db.commit()
+
+    def _db_delete(self, key: str) -> None:
+        with self._db_lock:
+            self._db.execute("DELETE FROM cache_entries WHERE cache_name = ? AND key = ?", (self.name, key))
+            self._db.commit()
+
+    async def get(self, key: str) -> tuple[Any | None, bool]:
+        """Look up value by key.
+
+        Returns:
+            Tuple of cached value (None on miss) and whether it is still fresh
+        """
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is None and self._db is not None:
+            entry = await asyncio.to_thread(self._db_get, key)
+            if entry is not None and entry.stale_until > now:
+                self.stats.disk_hits += 1
+                self._remember(key, entry)
+        if entry is None or entry.stale_until <= now:
+            if entry is not None:
+                await self.delete(key)
+            self.stats.misses += 1
+            return None, False
+
+        self._memory.move_to_end(key)
+        if entry.expires_at > now:
+            self.stats.hits += 1
+            return entry.value, True
+        self.stats.stale_hits += 1
+        return entry.value, False
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        serialized = None
+        size = 0
+        if self._db is not None or self.max_bytes is not None:
+            serialized = json.dumps(value, ensure_ascii=False)
+            size = len(serialized)
+        entry = CacheEntry(value=value, expires_at=now + ttl, stale_until=now + ttl + self.stale_ttl, size=size)
+        self._remember(key, entry)
+        if self._db is not None:
+            await asyncio.to_thread(self._db_set, key, entry, serialized)
+
+    async def delete(self, key: str) -> None:
+        self._forget(key)
+        if self._db is not None:
+            await asyncio.to_thread(self._db_delete, key)
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._memory_bytes
+
+    def close(self) -> None:
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+            self._db = None
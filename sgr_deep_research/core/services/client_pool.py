@@ -0,0 +1,97 @@
+import logging
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+import httpx
+from openai import AsyncOpenAI
+
+if TYPE_CHECKING:
+    from sgr_deep_research.core.agent_definition import LLMConfig
+
+logger = logging.getLogger(__name__)
+
+# Same defaults as the OpenAI SDK uses for its own http client
+DEFAULT_TIMEOUT = httpx.Timeout(timeout=600.0, connect=5.0)
+
+
+class LLMClientPool:
+    """Process-wide pool of AsyncOpenAI clients shared between agents.
+
+    Clients are keyed by endpoint, credentials, proxy and connection settings,
+    so every agent with the same LLM setup reuses one connection pool instead
+    of paying fresh TCP/TLS handshakes per research task.
+    """
+
+    _clients: dict[tuple, AsyncOpenAI] = {}
+
+    def __init__(self):
+        raise TypeError(f"{self.__class__.__name__} is a static class and cannot be instantiated")
+
+    @staticmethod
+    def _client_key(llm_config: "LLMConfig") -> tuple:
+        return (
+            llm_config.base_url,
+            llm_config.api_key,
+            llm_config.proxy,
+            llm_config.max_connections,
+            llm_config.max_keepalive_connections,
+            llm_config.keepalive_expiry,
+            llm_config.http2,
+        )
+
+    @classmethod
+    def _create_http_client(cls, llm_config: "LLMConfig") -> httpx.AsyncClient:
+        http2 = llm_config.http2
+        if http2 and find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but 'h2' package is not installed, falling back to HTTP/1.1")
+            http2 = False
+        return httpx.AsyncClient(
+            proxy=llm_config.proxy,
+            http2=http2,
+            timeout=DEFAULT_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=llm_config.max_connections,
+                max_keepalive_connections=llm_config.max_keepalive_connections,
+                keepalive_expiry=llm_config.keepalive_expiry,
+            ),
+        )
+
+    @classmethod
+    def get_client(cls, llm_config: "LLMConfig") -> AsyncOpenAI:
+        """Get shared client for the configuration, creating it on first use.
+
+        Args:
+            llm_config: LLM configuration
+
+        Returns:
+            Pooled AsyncOpenAI client
+        """
+        key = cls._client_key(llm_config)
+        client = cls._clients.get(key)
+        if client is None or client.is_closed():
+            client = AsyncOpenAI(
+                base_url=llm_config.base_url,
+                api_key=llm_config.api_key,
+                http_client=cls._create_http_client(llm_config),
+            )
+            cls._clients[key] = client
+            logger.info(f"Created pooled LLM client for {llm_config.base_url} (pool size: {len(cls._clients)})")
+        return client
+
+    @classmethod
+    def size(cls) -> int:
+        return len(cls._clients)
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close all pooled clients and their connections."""
+        clients = list(cls._clients.values())
+        cls._clients.clear()
+        for client in clients:
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"Failed to close LLM client: {e}")
+        if clients:
+            logger.info(f"Closed {len(clients)} pooled LLM clients")
@@ -0,0 +1,119 @@
+import asyncio
+import json
+import logging
+import re
+
+from openai import AsyncOpenAI
+
+logger = logging.getLogger(__name__)
+
+# Rough average for English and code, good enough to decide when to compact
+CHARS_PER_TOKEN = 4
+SOURCE_LINE_PATTERN = re.compile(r"^\[\d+\] .*$", re.MULTILINE)
+
+
+class ContextCompactor:
+    """Keeps agent conversation under a token budget by eliding old tool
+    results.
+
+    When the estimated prompt size crosses ``threshold_tokens``, every tool
+    result except the ``keep_last`` most recent ones is replaced with a short
+    stub: its beginning and the ``[n] title - url`` source lines, so citations
+    stay resolvable. Compacted messages are never touched again, which keeps
+    the conversation prefix stable between compactions.
+
+    Subclasses can override ``_compact_content`` to shrink results differently.
+    """
+
+    def __init__(self, threshold_tokens: int, keep_last: int = 4, stub_chars: int = 500):
+        self.threshold_tokens = threshold_tokens
+        self.keep_last = keep_last
+        self.stub_chars = stub_chars
+        self._compacted: set[int] = set()
+
+    @staticmethod
+    def estimate_tokens(messages: list[dict]) -> int:
+        chars = 0
+        for message in messages:
+            chars += len(message.get("content") or "")
+            for tool_call in message.get("tool_calls") or []:
+                chars += len(json.dumps(tool_call, ensure_ascii=False))
+        return chars // CHARS_PER_TOKEN
+
+    def _stub(self, content: str) -> str:
+        sources = "\n".join(SOURCE_LINE_PATTERN.findall(content[self.stub_chars :]))
+        stub = f"{content[: self.stub_chars]}\n...[{len(content) - self.stub_chars} chars elided]"
+        return f"{stub}\nSources:\n{sources}" if sources else stub
+
+    async def _compact_content(self, content: str) -> str:
+        return self._stub(content)
+
+    async def compact(self, conversation: list[dict]) -> bool:
+        """Compact conversation in place if it is over the threshold.
+
+        Returns:
+            Whether any message was compacted
+        """
+        tokens_before = self.estimate_tokens(conversation)
+        if tokens_before <= self.threshold_tokens:
+            return False
+        tool_messages = [message for message in conversation if message.get("role") == "tool"]
+        candidates = [
+            message
+            for message in tool_messages[: max(len(tool_messages) - self.keep_last, 0)]
+            if id(message) not in self._compacted and len(message.get("content") or "") > self.stub_chars
+        ]
+        if not candidates:
+            return False
+
+        contents = await asyncio.gather(*(self._compact_content(message["content"]) for message in candidates))
+        for message, content in zip(candidates, contents):
+            message["content"] = content
+            self._compacted.add(id(message))
+        logger.info(
+            f"🗜️ Compacted {len(candidates)} tool results: "
+            f"~{tokens_before} -> ~{self.estimate_tokens(conversation)} tokens"
+        )
+        return True
+
+
+class SummarizingContextCompactor(ContextCompactor):
+    """Context compactor that summarizes old tool results with a (cheap) LLM
+    instead of truncating them, falling back to a plain stub on errors."""
+
+    SUMMARY_PROMPT = (
+        "Summarize the tool output below for a research agent. Keep facts, numbers, dates, names "
+        "and [n] source references, drop everything else. Answer with the summary only."
+    )
+
+    def __init__(
+        self,
+        threshold_tokens: int,
+        openai_client: AsyncOpenAI,
+        model: str,
+        keep_last: int = 4,
+        stub_chars: int = 500,
+    ):
+        super().__init__(threshold_tokens=threshold_tokens, keep_last=keep_last, stub_chars=stub_chars)
+        self.openai_client = openai_client
+        self.model = model
+
+    async def _compact_content(self, content: str) -> str:
+        try:
+            completion = await self.openai_client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": self.SUMMARY_PROMPT},
+                    {"role": "user", "content": content},
+                ],
+                max_tokens=self.stub_chars // CHARS_PER_TOKEN * 2,
+                temperature=0,
+            )
+            summary = completion.choices[0].message.content
+        except Exception as e:
+            logger.warning(f"Failed to summarize tool result, eliding instead: {e}")
+            return self._stub(content)
+        if not summary:
+            return self._stub(content)
+        sources = "\n".join(SOURCE_LINE_PATTERN.findall(content))
+        return f"[Summary]\n{summary}\nSources:\n{sources}" if sources else f"[Summary]\n{summary}"
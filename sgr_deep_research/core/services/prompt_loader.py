@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
     from sgr_deep_research.core.agent_definition import PromptsConfig
@@ -7,9 +7,19 @@ if TYPE_CHECKING:
 
 
 class PromptLoader:
+    # Formatted system prompts are reused, so they stay byte-identical across iterations and agents
+    _system_prompts: ClassVar[dict[tuple, str]] = {}
+
     @classmethod
     def get_system_prompt(cls, available_tools: list["BaseTool"], prompts_config: "PromptsConfig") -> str:
         template = prompts_config.system_prompt
+        key = (template, tuple((tool.tool_name, tool.description) for tool in available_tools))
+        if key not in cls._system_prompts:
+            cls._system_prompts[key] = cls._format_system_prompt(template, available_tools)
+        return cls._system_prompts[key]
+
+    @classmethod
+    def _format_system_prompt(cls, template: str, available_tools: list["BaseTool"]) -> str:
         available_tools_str_list = [
             f"{i}. {tool.tool_name}: {tool.description}" for i, tool in enumerate(available_tools, start=1)
         ]
@@ -23,9 +33,11 @@ class PromptLoader:
     @classmethod
     def get_initial_user_request(cls, task: str, prompts_config: "PromptsConfig") -> str:
         template = prompts_config.initial_user_request
-        return template.format(task=task, current_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        return template.format(task=task, current_date=datetime.now().strftime(prompts_config.current_date_format))
 
     @classmethod
     def get_clarification_template(cls, clarifications: str, prompts_config: "PromptsConfig") -> str:
         template = prompts_config.clarification_response
-        return template.format(clarifications=clarifications, current_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        return template.format(
+            clarifications=clarifications, current_date=datetime.now().strftime(prompts_config.current_date_format)
+        )
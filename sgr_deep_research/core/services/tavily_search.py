@@ -1,20 +1,111 @@
+import asyncio
+import json
 import logging
+from typing import ClassVar
+from urllib.parse import urldefrag
 
+import httpx
 from tavily import AsyncTavilyClient
 
 from sgr_deep_research.core.agent_config import GlobalConfig
+from sgr_deep_research.core.agent_definition import SearchConfig
 from sgr_deep_research.core.models import SourceData
+from sgr_deep_research.core.services.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 
 class TavilySearchService:
-    def __init__(self):
-        config = GlobalConfig()
+    _instances: ClassVar[dict[tuple, "TavilySearchService"]] = {}
+
+    def __init__(self, search_config: SearchConfig | None = None):
+        self._search_config = search_config or GlobalConfig().search
+        self._http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout=120.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=self._search_config.max_connections,
+                max_keepalive_connections=self._search_config.max_keepalive_connections,
+            ),
+        )
         self._client = AsyncTavilyClient(
-            api_key=config.search.tavily_api_key, api_base_url=config.search.tavily_api_base_url
+            api_key=self._search_config.tavily_api_key,
+            api_base_url=self._search_config.tavily_api_base_url,
+            client=self._http_client,
+        )
+        self._search_cache: TTLCache | None = None
+        if self._search_config.cache_ttl > 0:
+            self._search_cache = TTLCache(
+                name="search",
+                ttl=self._search_config.cache_ttl,
+                stale_ttl=self._search_config.cache_stale_ttl,
+                max_entries=self._search_config.cache_max_entries,
+                db_path=self._search_config.cache_path,
+            )
+        self._page_cache: TTLCache | None = None
+        if self._search_config.page_cache_ttl > 0:
+            self._page_cache = TTLCache(
+                name="page",
+                ttl=self._search_config.page_cache_ttl,
+                max_entries=self._search_config.cache_max_entries,
+                max_bytes=self._search_config.page_cache_max_bytes,
+                db_path=self._search_config.cache_path,
+            )
+        self._revalidation_tasks: dict[str, asyncio.Task] = {}
+
+    @classmethod
+    def get_instance(cls, search_config: SearchConfig | None = None) -> "TavilySearchService":
+        """Get long-lived search service shared by all tools using the same
+        search config.
+
+        Args:
+            search_config: Search configuration (default from global config)
+
+        Returns:
+            Shared TavilySearchService with a warm connection pool
+        """
+        search_config = search_config or GlobalConfig().search
+        key = (
+            search_config.tavily_api_key,
+            search_config.tavily_api_base_url,
+            search_config.max_connections,
+            search_config.max_keepalive_connections,
+            search_config.cache_ttl,
+            search_config.cache_stale_ttl,
+            search_config.cache_max_entries,
+            search_config.cache_path,
+            search_config.page_cache_ttl,
+            search_config.page_cache_failed_ttl,
+            search_config.page_cache_max_bytes,
         )
-        self._config = config
+        instance = cls._instances.get(key)
+        if instance is None or instance._http_client.is_closed:
+            instance = cls(search_config)
+            cls._instances[key] = instance
+        return instance
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close connection pools of all shared search services."""
+        instances = list(cls._instances.values())
+        cls._instances.clear()
+        for instance in instances:
+            await instance.close()
+
+    async def close(self) -> None:
+        for task in self._revalidation_tasks.values():
+            task.cancel()
+        for cache in (self._search_cache, self._page_cache):
+            if cache is not None:
+                cache.close()
+        await self._http_client.aclose()
+
+    @property
+    def search_cache(self) -> TTLCache | None:
+        return self._search_cache
+
+    @property
+    def page_cache(self) -> TTLCache | None:
+        return self._page_cache
 
     @staticmethod
     def rearrange_sources(sources: list[SourceData], starting_number=1) -> list[SourceData]:
@@ -31,6 +122,9 @@ class TavilySearchService:
         """Perform search through Tavily API and return results with
         SourceData.
 
+        Results are served from cache when the same normalized query was
+        searched recently.
+
         Args:
             query: Search query
             max_results: Maximum number of results (default from config)
@@ -39,7 +133,24 @@ class TavilySearchService:
         Returns:
             Tuple with tavily answer and list of SourceData
         """
-        max_results = max_results or self._config.search.max_results
+        max_results = max_results or self._search_config.max_results
+        if self._search_cache is None:
+            return await self._search(query, max_results, include_raw_content)
+
+        key = self._search_cache_key(query, max_results, include_raw_content)
+        cached, fresh = await self._search_cache.get(key)
+        if cached is None:
+            sources = await self._search(query, max_results, include_raw_content)
+            await self._search_cache.set(key, [source.model_dump() for source in sources])
+            return sources
+
+        logger.info(f"🔍 Tavily search cache hit: '{query}' (fresh={fresh})")
+        if not fresh:
+            self._revalidate_search(key, query, max_results, include_raw_content)
+        # Fresh copies, tools renumber sources in place
+        return [SourceData(**source) for source in cached]
+
+    async def _search(self, query: str, max_results: int, include_raw_content: bool) -> list[SourceData]:
         logger.info(f"🔍 Tavily search: '{query}' (max_results={max_results})")
 
         # Execute search through Tavily
@@ -53,15 +164,84 @@ class TavilySearchService:
         sources = self._convert_to_source_data(response)
         return sources
 
+    @staticmethod
+    def _search_cache_key(query: str, max_results: int, include_raw_content: bool) -> str:
+        normalized_query = " ".join(query.lower().split())
+        return json.dumps([normalized_query, max_results, include_raw_content], ensure_ascii=False)
+
+    def _revalidate_search(self, key: str, query: str, max_results: int, include_raw_content: bool) -> None:
+        """Refresh stale cache entry in background, once per key."""
+        if key in self._revalidation_tasks:
+            return
+
+        async def revalidate():
+            try:
+                sources = await self._search(query, max_results, include_raw_content)
+                await self._search_cache.set(key, [source.model_dump() for source in sources])
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to revalidate search '{query}': {e}")
+            finally:
+                self._revalidation_tasks.pop(key, None)
+
+        self._revalidation_tasks[key] = asyncio.create_task(revalidate())
+
     async def extract(self, urls: list[str]) -> list[SourceData]:
         """Extract full content from specific URLs using Tavily Extract API.
 
+        Only URLs missing in the page cache are sent to Tavily, URLs that
+        recently failed are not retried until their negative entry expires.
+
         Args:
             urls: List of URLs to extract content from
 
         Returns:
-            List of SourceData with extracted content
+            List of SourceData with extracted content, in order of requested URLs
         """
+        if self._page_cache is None:
+            sources, _ = await self._extract(urls)
+            return sources
+
+        pages: dict[str, dict] = {}
+        missing_urls = []
+        for url in dict.fromkeys(urls):
+            page, _ = await self._page_cache.get(self._page_cache_key(url))
+            if page is None:
+                missing_urls.append(url)
+            else:
+                pages[url] = page
+
+        if pages:
+            logger.info(f"📄 Tavily extract cache hit: {len(pages)}/{len(urls)} URLs")
+        if missing_urls:
+            sources, failed_urls = await self._extract(missing_urls)
+            for source in sources:
+                page = {"url": source.url, "title": source.title, "content": source.full_content}
+                pages[source.url] = page
+                await self._page_cache.set(self._page_cache_key(source.url), page)
+            for url in failed_urls:
+                await self._page_cache.set(
+                    self._page_cache_key(url), {"failed": True}, ttl=self._search_config.page_cache_failed_ttl
+                )
+
+        sources = []
+        # Tavily may report a normalized URL, keep such pages after requested ones
+        for url in [*urls, *(url for url in pages if url not in urls)]:
+            page = pages.get(url)
+            if page is None or page.get("failed"):
+                continue
+            sources.append(
+                SourceData(
+                    number=len(sources),
+                    title=page["title"],
+                    url=page["url"],
+                    snippet="",
+                    full_content=page["content"],
+                    char_count=len(page["content"]),
+                )
+            )
+        return sources
+
+    async def _extract(self, urls: list[str]) -> tuple[list[SourceData], list[str]]:
         logger.info(f"📄 Tavily extract: {len(urls)} URLs")
 
         response = await self._client.extract(urls=urls)
@@ -81,11 +261,15 @@ class TavilySearchService:
             )
             sources.append(source)
 
-        failed_urls = response.get("failed_results", [])
-        if failed_urls:
-            logger.warning(f"⚠️ Failed to extract {len(failed_urls)} URLs: {failed_urls}")
+        failed_results = response.get("failed_results", [])
+        if failed_results:
+            logger.warning(f"⚠️ Failed to extract {len(failed_results)} URLs: {failed_results}")
+        failed_urls = [result.get("url") if isinstance(result, dict) else result for result in failed_results]
+        return sources, [url for url in failed_urls if url]
 
-        return sources
+    @staticmethod
+    def _page_cache_key(url: str) -> str:
+        return urldefrag(url.strip()).url
 
     def _convert_to_source_data(self, response: dict) -> list[SourceData]:
         """Convert Tavily response to SourceData list."""
@@ -33,6 +33,9 @@ class OpenAIStreamingGenerator(StreamingGenerator):
         self.choice_index = 0
 
     def add_chunk(self, chunk: ChatCompletionChunk):
+        if not chunk.choices:
+            # Usage-only chunk requested via stream_options, accumulated usage is reported in finish()
+            return
         chunk.model = self.model
         super().add(f"data: {chunk.model_dump_json()}\n\n")
 
@@ -84,7 +87,7 @@ class OpenAIStreamingGenerator(StreamingGenerator):
         }
         super().add(f"data: {json.dumps(response)}\n\n")
 
-    def finish(self, finish_reason: str = "stop"):
+    def finish(self, finish_reason: str = "stop", usage: dict | None = None):
         """Finishes stream with final chunk and usage."""
         final_response = {
             "id": self.id,
@@ -93,7 +96,7 @@ class OpenAIStreamingGenerator(StreamingGenerator):
             "model": self.model,
             "system_fingerprint": f"fp_{hex(hash(self.model))[-8:]}",
             "choices": [{"index": self.choice_index, "delta": {}, "logprobs": None, "finish_reason": finish_reason}],
-            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            "usage": usage or {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
         }
         super().add(f"data: {json.dumps(final_response)}\n\n")
         super().add("data: [DONE]\n\n")
@@ -3,6 +3,7 @@ from sgr_deep_research.core.base_tool import (
     # MCPBaseTool,
 )
 from sgr_deep_research.core.next_step_tool import (
+    FunctionToolsBuilder,
     NextStepToolsBuilder,
     NextStepToolStub,
 )
@@ -36,6 +37,7 @@ __all__ = [
     # "MCPBaseTool",
     "NextStepToolStub",
     "NextStepToolsBuilder",
+    "FunctionToolsBuilder",
     # Individual tools
     "ClarificationTool",
     "GeneratePlanTool",
@@ -35,28 +35,18 @@ class ExtractPageContentTool(BaseTool):
     reasoning: str = Field(description="Why extract these specific pages")
     urls: list[str] = Field(description="List of URLs to extract full content from", min_length=1, max_length=5)
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self._search_service = TavilySearchService()
-
     async def __call__(self, context: ResearchContext) -> str:
         """Extract full content from specified URLs."""
 
         logger.info(f"📄 Extracting content from {len(self.urls)} URLs")
 
-        sources = await self._search_service.extract(urls=self.urls)
+        sources = await TavilySearchService.get_instance().extract(urls=self.urls)
 
-        # Update existing sources instead of overwriting
+        # Update existing sources instead of overwriting, known URLs keep original number
         for source in sources:
-            if source.url in context.sources:
-                # URL already exists, update with full content but keep original number
-                existing = context.sources[source.url]
-                existing.full_content = source.full_content
-                existing.char_count = source.char_count
-            else:
-                # New URL, add with next number
-                source.number = len(context.sources) + 1
-                context.sources[source.url] = source
+            existing = context.add_source(source)
+            existing.full_content = source.full_content
+            existing.char_count = source.char_count
 
         formatted_result = "Extracted Page Content:\n\n"
 
@@ -52,25 +52,18 @@ class WebSearchTool(BaseTool):
         le=10,
     )
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self._search_service = TavilySearchService()
-
     async def __call__(self, context: ResearchContext) -> str:
         """Execute web search using TavilySearchService."""
 
         logger.info(f"🔍 Search query: '{self.query}'")
 
-        sources = await self._search_service.search(
+        sources = await TavilySearchService.get_instance().search(
             query=self.query,
             max_results=self.max_results,
             include_raw_content=False,
         )
 
-        sources = TavilySearchService.rearrange_sources(sources, starting_number=len(context.sources) + 1)
-
-        for source in sources:
-            context.sources[source.url] = source
+        sources = [context.add_source(source) for source in sources]
 
         search_result = SearchResult(
             query=self.query,
@@ -35,16 +35,12 @@ class ExtractPageContentTool_functional(BaseTool_functional):
     reasoning: str = Field(description="Why extract these specific pages")
     urls: list[str] = Field(description="List of URLs to extract full content from", min_length=1, max_length=5)
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self._search_service = TavilySearchService()
-
     async def __call__(self, context: ResearchContextCounted) -> str:
         """Extract full content from specified URLs."""
 
         logger.info(f"📄 Extracting content from {len(self.urls)} URLs")
 
-        sources = await self._search_service.extract(urls=self.urls)
+        sources = await TavilySearchService.get_instance().extract(urls=self.urls)
 
         # Update existing sources instead of overwriting
         for source in sources:
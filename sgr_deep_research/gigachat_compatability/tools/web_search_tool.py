@@ -51,16 +51,12 @@ class WebSearchTool_functional(BaseTool_functional):
         le=10,
     )
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self._search_service = TavilySearchService()
-
     async def __call__(self, context: ResearchContextCounted) -> str:
         """Execute web search using TavilySearchService."""
 
         logger.info(f"🔍 Search query: '{self.query}'")
 
-        sources = await self._search_service.search(
+        sources = await TavilySearchService.get_instance().search(
             query=self.query,
             max_results=self.max_results,
             include_raw_content=False,
@@ -23,6 +23,7 @@ from sgr_deep_research.core.agents import (
     ToolCallingAgent,
 )
 from sgr_deep_research.core.base_agent import BaseAgent
+from sgr_deep_research.core.services import LLMClientPool
 from sgr_deep_research.core.tools import BaseTool, ReasoningTool
 
 
@@ -306,6 +307,10 @@ class TestAgentCreationEdgeCases:
 class TestAgentFactoryClientCreation:
     """Tests for OpenAI client creation in AgentFactory."""
 
+    def teardown_method(self):
+        """Drop pooled clients between tests."""
+        LLMClientPool._clients.clear()
+
     def test_create_client_without_proxy(self):
         """Test creating OpenAI client without proxy."""
         llm_config = LLMConfig(
@@ -345,6 +350,40 @@ class TestAgentFactoryClientCreation:
         assert client.api_key == "test-key"
         assert client._client is not None
 
+    def test_create_client_reuses_pooled_client(self):
+        """Test that agents with the same LLM setup share one client."""
+        llm_config = LLMConfig(api_key="test-key", base_url="https://api.openai.com/v1")
+        other_model_config = llm_config.model_copy(update={"model": "gpt-4o"})
+
+        client = AgentFactory._create_client(llm_config)
+
+        assert AgentFactory._create_client(llm_config) is client
+        assert AgentFactory._create_client(other_model_config) is client
+
+    def test_create_client_separates_different_endpoints(self):
+        """Test that different endpoints, keys or proxies get separate clients."""
+        llm_config = LLMConfig(api_key="test-key", base_url="https://api.openai.com/v1")
+
+        client = AgentFactory._create_client(llm_config)
+
+        assert AgentFactory._create_client(llm_config.model_copy(update={"api_key": "other-key"})) is not client
+        assert AgentFactory._create_client(llm_config.model_copy(update={"base_url": "http://localhost"})) is not client
+        assert (
+            AgentFactory._create_client(llm_config.model_copy(update={"proxy": "http://127.0.0.1:8080"})) is not client
+        )
+
+    @pytest.mark.asyncio
+    async def test_close_all_clients(self):
+        """Test that closing the pool closes clients and empties it."""
+        llm_config = LLMConfig(api_key="test-key", base_url="https://api.openai.com/v1")
+        client = AgentFactory._create_client(llm_config)
+
+        await LLMClientPool.close_all()
+
+        assert client.is_closed()
+        assert LLMClientPool.size() == 0
+        assert AgentFactory._create_client(llm_config) is not client
+
 
 class TestAgentFactoryRegistryIntegration:
     """Tests for AgentFactory integration with registries."""
@@ -0,0 +1,93 @@
+"""Tests for AgentScheduler.
+
+This module contains tests for admission control of agent executions:
+running limits, waiting queue and queue overflow.
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from sgr_deep_research.core.agent_definition import SchedulerConfig
+from sgr_deep_research.core.services import AgentQueueFullError, AgentScheduler
+
+
+class BlockingAgent:
+    """Agent stub whose execution lasts until released."""
+
+    def __init__(self, agent_id: str):
+        self.id = agent_id
+        self.streaming_generator = Mock()
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def execute(self):
+        self.started.set()
+        await self.release.wait()
+
+
+class TestAgentScheduler:
+    """Tests for running limits and waiting queue."""
+
+    @pytest.mark.asyncio
+    async def test_agents_start_until_limit_then_queue(self):
+        scheduler = AgentScheduler(SchedulerConfig(max_running_agents=1))
+        first, second = BlockingAgent("first"), BlockingAgent("second")
+
+        assert scheduler.submit(first, "sgr_agent") == 0
+        assert scheduler.submit(second, "sgr_agent") == 1
+        await first.started.wait()
+
+        assert scheduler.running_count == 1
+        assert scheduler.queue_position("second") == 1
+        second.streaming_generator.add_chunk_from_str.assert_called_with("⏳ Waiting in queue, position 1\n")
+
+        first.release.set()
+        await asyncio.wait_for(second.started.wait(), timeout=1)
+        assert scheduler.queued_count == 0
+        second.release.set()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_raises_with_retry_after(self):
+        scheduler = AgentScheduler(SchedulerConfig(max_running_agents=1, max_queued_agents=1, retry_after=15))
+        agents = [BlockingAgent(f"agent_{i}") for i in range(3)]
+        scheduler.submit(agents[0], "sgr_agent")
+        scheduler.submit(agents[1], "sgr_agent")
+
+        with pytest.raises(AgentQueueFullError) as exc_info:
+            scheduler.submit(agents[2], "sgr_agent")
+
+        assert exc_info.value.retry_after == 15
+        await scheduler.cancel_all()
+
+    @pytest.mark.asyncio
+    async def test_definition_limit_does_not_block_other_definitions(self):
+        scheduler = AgentScheduler(SchedulerConfig(max_running_agents=5, definition_limits={"slow_agent": 1}))
+        slow_first, slow_second, fast = BlockingAgent("slow_1"), BlockingAgent("slow_2"), BlockingAgent("fast")
+
+        scheduler.submit(slow_first, "slow_agent")
+        assert scheduler.submit(slow_second, "slow_agent") == 1
+        scheduler.submit(fast, "fast_agent")
+        await asyncio.wait_for(fast.started.wait(), timeout=1)
+
+        assert scheduler.running_count == 2
+        assert scheduler.queue_position("slow_2") == 1
+
+        slow_first.release.set()
+        await asyncio.wait_for(slow_second.started.wait(), timeout=1)
+        await scheduler.cancel_all()
+
+    @pytest.mark.asyncio
+    async def test_cancel_all_stops_running_agents(self):
+        scheduler = AgentScheduler(SchedulerConfig(max_running_agents=1))
+        running, queued = BlockingAgent("running"), BlockingAgent("queued")
+        scheduler.submit(running, "sgr_agent")
+        scheduler.submit(queued, "sgr_agent")
+        await running.started.wait()
+
+        await scheduler.cancel_all()
+
+        assert scheduler.running_count == 0
+        assert scheduler.queued_count == 0
+        assert not queued.started.is_set()
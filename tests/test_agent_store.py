@@ -0,0 +1,146 @@
+"""Tests for AgentStore.
+
+This module contains tests for agent eviction policies and snapshot
+backends used by the API agent store.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from sgr_deep_research.core.agent_definition import AgentStoreConfig
+from sgr_deep_research.core.agents import SGRAgent
+from sgr_deep_research.core.models import AgentStatesEnum
+from sgr_deep_research.core.services import AgentSnapshotBackend, AgentStore, SQLiteAgentSnapshotBackend
+from tests.conftest import create_test_agent
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake_clock = FakeClock()
+    with patch("sgr_deep_research.core.services.agent_store.time.time", fake_clock):
+        yield fake_clock
+
+
+def create_agent(task: str = "Test task", state: AgentStatesEnum = AgentStatesEnum.RESEARCHING) -> SGRAgent:
+    agent = create_test_agent(SGRAgent, task=task)
+    agent._context.state = state
+    return agent
+
+
+class TestAgentStoreEviction:
+    """Tests for AgentStore eviction policies."""
+
+    @pytest.mark.asyncio
+    async def test_finished_agent_evicted_after_ttl(self, clock):
+        store = AgentStore(AgentStoreConfig(finished_ttl=60))
+        agent = create_agent(state=AgentStatesEnum.COMPLETED)
+        await store.add(agent)
+        assert agent.id in store
+
+        clock.now += 61
+        await store.evict()
+
+        assert agent.id not in store
+        snapshot = await store.get_snapshot(agent.id)
+        assert snapshot.task == "Test task"
+        assert snapshot.state == AgentStatesEnum.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_running_agents_never_evicted(self, clock):
+        store = AgentStore(AgentStoreConfig(max_agents=1, finished_ttl=0))
+        running = create_agent(state=AgentStatesEnum.RESEARCHING)
+        waiting = create_agent(state=AgentStatesEnum.WAITING_FOR_CLARIFICATION)
+
+        await store.add(running)
+        await store.add(waiting)
+
+        assert len(store) == 2
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_finished_agent_evicted_over_max_agents(self, clock):
+        store = AgentStore(AgentStoreConfig(max_agents=2))
+        first = create_agent(state=AgentStatesEnum.COMPLETED)
+        second = create_agent(state=AgentStatesEnum.COMPLETED)
+        await store.add(first)
+        await store.add(second)
+        store.get(first.id)
+
+        await store.add(create_agent())
+
+        assert first.id in store
+        assert second.id not in store
+        assert store.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_finished_agents_evicted_over_memory_bound(self, clock):
+        store = AgentStore(AgentStoreConfig(max_memory_bytes=1000))
+        agent = create_agent(state=AgentStatesEnum.COMPLETED)
+        agent.conversation.append({"role": "tool", "content": "x" * 2000})
+
+        await store.add(agent)
+
+        assert agent.id not in store
+        assert store.memory_bytes() == 0
+
+    @pytest.mark.asyncio
+    async def test_list_snapshots_includes_evicted_agents(self, clock):
+        store = AgentStore(AgentStoreConfig(finished_ttl=0))
+        finished = create_agent("Finished", state=AgentStatesEnum.COMPLETED)
+        running = create_agent("Running")
+        await store.add(finished)
+        await store.add(running)
+
+        snapshots = await store.list_snapshots()
+
+        assert {snapshot.task for snapshot in snapshots} == {"Finished", "Running"}
+        assert running.id in store
+        assert finished.id not in store
+
+
+class TestAgentSnapshotBackends:
+    """Tests for in-memory and SQLite snapshot backends."""
+
+    @pytest.mark.asyncio
+    async def test_memory_backend_expires_snapshots(self, clock):
+        backend = AgentSnapshotBackend(ttl=10)
+        store = AgentStore(AgentStoreConfig(finished_ttl=0), backend=backend)
+        agent = create_agent(state=AgentStatesEnum.COMPLETED)
+        await store.add(agent)
+
+        clock.now += 11
+
+        assert await store.get_snapshot(agent.id) is None
+
+    @pytest.mark.asyncio
+    async def test_memory_backend_is_bounded(self, clock):
+        backend = AgentSnapshotBackend(ttl=10, max_entries=1)
+        store = AgentStore(AgentStoreConfig(finished_ttl=0), backend=backend)
+        await store.add(create_agent(state=AgentStatesEnum.COMPLETED))
+        await store.add(create_agent(state=AgentStatesEnum.COMPLETED))
+
+        assert len(await backend.list()) == 1
+
+    @pytest.mark.asyncio
+    async def test_sqlite_backend_survives_restart(self, clock, tmp_path):
+        db_path = str(tmp_path / "agents.sqlite")
+        store = AgentStore(AgentStoreConfig(finished_ttl=0, db_path=db_path))
+        agent = create_agent(state=AgentStatesEnum.FAILED)
+        agent._context.token_usage.prompt_tokens = 42
+        await store.add(agent)
+        store.close()
+
+        restarted_backend = SQLiteAgentSnapshotBackend(db_path, ttl=10)
+        snapshot = await restarted_backend.load(agent.id)
+
+        assert snapshot.state == AgentStatesEnum.FAILED
+        assert snapshot.token_usage.prompt_tokens == 42
+        restarted_backend.close()
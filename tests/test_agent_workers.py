@@ -0,0 +1,110 @@
+"""Tests for AgentWorkerPool.
+
+This module contains tests for agents executed in worker processes:
+stream relaying, clarification forwarding and state updates.
+"""
+
+import asyncio
+import os
+
+import pytest
+import yaml
+
+from sgr_deep_research.core.agent_definition import SchedulerConfig
+from sgr_deep_research.core.base_agent import BaseAgent
+from sgr_deep_research.core.models import AgentStatesEnum
+from sgr_deep_research.core.services import AgentWorkerPool
+
+
+class EchoAgent(BaseAgent):
+    """Agent echoing its task and clarification without LLM calls."""
+
+    name: str = "echo_agent"
+
+    async def execute(self):
+        self.streaming_generator.add_chunk_from_str(f"{os.getpid()}: {self.task}")
+        self._context.state = AgentStatesEnum.WAITING_FOR_CLARIFICATION
+        self.streaming_generator.finish()
+        await self._context.clarification_received.wait()
+        self._context.execution_result = f"clarified {self._context.clarifications_used}"
+        self._context.state = AgentStatesEnum.COMPLETED
+        self.streaming_generator.add_chunk_from_str("done")
+        self.streaming_generator.finish()
+
+
+async def read_stream(agent) -> str:
+    return "".join([chunk async for chunk in agent.streaming_generator.stream()])
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        yaml.safe_dump(
+            {
+                "llm": {"api_key": "test-key", "model": "gpt-4o-mini"},
+                "execution": {"logs_dir": str(tmp_path / "logs")},
+                "agents": {"echo_agent": {"base_class": f"{__name__}.EchoAgent", "tools": ["finalanswertool"]}},
+            }
+        )
+    )
+    return str(config_path)
+
+
+class TestAgentWorkerPool:
+    """Tests for agents executed in worker processes."""
+
+    @pytest.mark.asyncio
+    async def test_agent_runs_in_worker_process_with_clarification(self, config_file):
+        pool = AgentWorkerPool(SchedulerConfig(worker_processes=1))
+        pool.start(config_file=config_file)
+        try:
+            agent = pool.create_agent("echo_agent", "Test task")
+            execution = asyncio.create_task(agent.execute())
+
+            first_stream = await asyncio.wait_for(read_stream(agent), timeout=60)
+            assert "Test task" in first_stream
+            assert str(os.getpid()) not in first_stream
+            assert agent._context.state == AgentStatesEnum.WAITING_FOR_CLARIFICATION
+
+            await agent.provide_clarification("More details")
+            second_stream = await asyncio.wait_for(read_stream(agent), timeout=10)
+            await asyncio.wait_for(execution, timeout=10)
+
+            assert "done" in second_stream
+            assert agent.snapshot().state == AgentStatesEnum.COMPLETED
+            assert agent.snapshot().execution_result == "clarified 1"
+        finally:
+            await pool.stop()
+
+    @pytest.mark.asyncio
+    async def test_unknown_definition_fails_agent(self, config_file):
+        pool = AgentWorkerPool(SchedulerConfig(worker_processes=1))
+        pool.start(config_file=config_file)
+        try:
+            agent = pool.create_agent("missing_agent", "Test task")
+            await asyncio.wait_for(agent.execute(), timeout=60)
+
+            assert "not found" in await read_stream(agent)
+            assert agent._context.state == AgentStatesEnum.FAILED
+        finally:
+            await pool.stop()
+
+    @pytest.mark.asyncio
+    async def test_agents_of_dead_worker_fail(self, config_file):
+        pool = AgentWorkerPool(SchedulerConfig(worker_processes=1))
+        pool.start(config_file=config_file)
+        try:
+            agent = pool.create_agent("echo_agent", "Test task")
+            execution = asyncio.create_task(agent.execute())
+            await asyncio.wait_for(read_stream(agent), timeout=60)
+            pool._processes[0].kill()
+
+            await asyncio.wait_for(execution, timeout=10)
+
+            assert agent._context.state == AgentStatesEnum.FAILED
+        finally:
+            await pool.stop()
+
+    def test_disabled_by_default(self):
+        assert not AgentWorkerPool(SchedulerConfig()).enabled
@@ -22,6 +22,7 @@ from sgr_deep_research.api.endpoints import (
 from sgr_deep_research.api.models import ChatCompletionRequest, ChatMessage, ClarificationRequest
 from sgr_deep_research.core.agents import SGRAgent
 from sgr_deep_research.core.models import AgentStatesEnum
+from sgr_deep_research.core.services import AgentQueueFullError
 from tests.conftest import create_test_agent
 
 
@@ -123,6 +124,7 @@ class TestChatCompletionEndpoint:
         """Test successful creation of new agent."""
         mock_agent = Mock()
         mock_agent.id = "test_agent_12345678-1234-1234-1234-123456789012"
+        mock_agent._context.state = AgentStatesEnum.INITED
         mock_agent.streaming_generator.stream.return_value = iter(["chunk1", "chunk2"])
 
         # Use actual async function instead of AsyncMock to avoid warnings
@@ -143,7 +145,7 @@ class TestChatCompletionEndpoint:
         )
 
         # Mock asyncio.create_task to properly handle coroutines
-        with patch("sgr_deep_research.api.endpoints.asyncio.create_task") as mock_create_task:
+        with patch("sgr_deep_research.core.services.agent_scheduler.asyncio.create_task") as mock_create_task:
             # Schedule the coroutine via event loop to avoid 'never awaited' warnings
             def mock_create_task_func(coro):
                 loop = asyncio.get_event_loop()
@@ -161,6 +163,31 @@ class TestChatCompletionEndpoint:
             # Verify execute task was created
             mock_create_task.assert_called_once()
 
+    @patch("sgr_deep_research.api.endpoints.agents_scheduler")
+    @patch("sgr_deep_research.api.endpoints.AgentFactory")
+    @pytest.mark.asyncio
+    async def test_full_queue_returns_429(self, mock_factory, mock_scheduler):
+        """Test that request is rejected with Retry-After when agent queue is
+        full."""
+        mock_agent = Mock()
+        mock_agent.id = "test_agent_12345678-1234-1234-1234-123456789012"
+        mock_agent_def = Mock()
+        mock_agent_def.name = "sgr_agent"
+        mock_factory.get_definitions_list.return_value = [mock_agent_def]
+        mock_factory.create = AsyncMock(return_value=mock_agent)
+        mock_scheduler.submit.side_effect = AgentQueueFullError(retry_after=30)
+
+        request = ChatCompletionRequest(
+            model="sgr_agent", messages=[ChatMessage(role="user", content="Test task")], stream=True
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await create_chat_completion(request)
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.headers["Retry-After"] == "30"
+        assert mock_agent.id not in agents_storage
+
     @pytest.mark.asyncio
     async def test_non_streaming_request_raises_error(self):
         """Test that non-streaming request raises HTTPException."""
@@ -238,6 +265,18 @@ class TestAgentStateEndpoint:
         assert response.task == "Test task"
         assert response.sources_count == 2
 
+    @pytest.mark.asyncio
+    async def test_get_agent_state_includes_token_usage(self):
+        """Test that agent state exposes total and per phase token usage."""
+        agent = create_test_agent(SGRAgent, task="Test task")
+        agent._accumulate_tokens(Mock(prompt_tokens=100, completion_tokens=10, prompt_tokens_details=None), "reasoning")
+        agents_storage[agent.id] = agent
+
+        response = await get_agent_state(agent.id)
+
+        assert response.token_usage.total_tokens == 110
+        assert response.phase_token_usage["reasoning"].prompt_tokens == 100
+
     @pytest.mark.asyncio
     async def test_get_agent_state_not_found(self):
         """Test agent state retrieval for non-existent agent."""
@@ -5,15 +5,17 @@ including initialization, logging, clarification handling, and execution
 flow.
 """
 
+import asyncio
 import uuid
 from datetime import datetime
 from unittest.mock import Mock
 
 import pytest
 
+from sgr_deep_research.core.agent_definition import ExecutionConfig
 from sgr_deep_research.core.base_agent import BaseAgent
 from sgr_deep_research.core.models import AgentStatesEnum, ResearchContext
-from sgr_deep_research.core.tools import BaseTool, ReasoningTool
+from sgr_deep_research.core.tools import BaseTool, ReasoningTool, WebSearchTool
 from tests.conftest import create_test_agent
 
 
@@ -243,6 +245,42 @@ class TestBaseAgentLogging:
         assert log_entry["agent_tool_execution_result"] == result
 
 
+class TestBaseAgentTokenUsage:
+    """Tests for token usage accounting and token budget."""
+
+    def test_accumulate_tokens_counts_cached_prompt_tokens(self):
+        """Test that token usage is accumulated in total and per phase."""
+        agent = create_test_agent(BaseAgent)
+        usage = Mock(prompt_tokens=1000, completion_tokens=50, prompt_tokens_details=Mock(cached_tokens=768))
+
+        agent._accumulate_tokens(usage, "reasoning")
+        agent._accumulate_tokens(usage, "select_action")
+        agent._accumulate_tokens(None, "reasoning")
+
+        assert agent._context.token_usage.prompt_tokens == 2000
+        assert agent._context.token_usage.cached_tokens == 1536
+        assert agent._context.token_usage.total_tokens == 2100
+        assert agent._context.phase_token_usage["reasoning"].completion_tokens == 50
+
+    def test_token_budget_exhausted(self):
+        """Test that token budget keeps a reserve for the final answer."""
+        agent = create_test_agent(
+            BaseAgent, execution_config=ExecutionConfig(token_budget=10000, token_budget_reserve=2000)
+        )
+        assert agent._token_budget_exhausted() is False
+
+        agent._accumulate_tokens(Mock(prompt_tokens=7000, completion_tokens=1000, prompt_tokens_details=None), "x")
+
+        assert agent._token_budget_exhausted() is True
+
+    def test_token_budget_unlimited_by_default(self):
+        """Test that agents without budget are never forced to finish."""
+        agent = create_test_agent(BaseAgent)
+        agent._context.token_usage.prompt_tokens = 10**9
+
+        assert agent._token_budget_exhausted() is False
+
+
 class TestBaseAgentAbstractMethods:
     """Tests for abstract methods that must be implemented by subclasses."""
 
@@ -309,3 +347,61 @@ class TestBaseAgentPrepareContext:
         context = await agent._prepare_context()
 
         assert len(context) == 4  # system + 3 messages
+
+
+class SlowTool(BaseTool):
+    """Tool that records execution order for concurrency tests."""
+
+    label: str
+    delay: float = 0.0
+
+    async def __call__(self, context: ResearchContext) -> str:
+        await asyncio.sleep(self.delay)
+        return f"result {self.label}"
+
+
+class TestBaseAgentParallelTools:
+    """Tests for running several tool calls in one step."""
+
+    @staticmethod
+    def create_parallel_agent(**execution_kwargs) -> BaseAgent:
+        return create_test_agent(
+            BaseAgent,
+            task="Test",
+            execution_config=ExecutionConfig(parallel_tool_calls=True, **execution_kwargs),
+        )
+
+    @pytest.mark.asyncio
+    async def test_run_tools_concurrently_in_call_order(self):
+        """Test that tools run concurrently and results keep call order."""
+        agent = self.create_parallel_agent()
+        agent._context.iteration = 2
+        tools = [SlowTool(label="a", delay=0.2), SlowTool(label="b", delay=0.2), SlowTool(label="c")]
+
+        started = asyncio.get_running_loop().time()
+        results = await agent._run_tools(tools)
+        elapsed = asyncio.get_running_loop().time() - started
+
+        assert results == ["result a", "result b", "result c"]
+        assert elapsed < 0.35
+        assert [message["tool_call_id"] for message in agent.conversation] == ["2-action", "2-action-1", "2-action-2"]
+        assert [message["content"] for message in agent.conversation] == results
+        assert len(agent.log) == 3
+
+    def test_limit_parallel_tools_disabled_keeps_first(self):
+        """Test that only the first tool call is used without parallel mode."""
+        agent = create_test_agent(BaseAgent, task="Test")
+        tools = [SlowTool(label="a"), SlowTool(label="b")]
+
+        assert agent._limit_parallel_tools(tools) == tools[:1]
+
+    def test_limit_parallel_tools_respects_limits(self):
+        """Test that parallel calls are capped and respect search budget."""
+        agent = self.create_parallel_agent(max_parallel_tool_calls=3, max_searches=2)
+        agent._context.searches_used = 1
+        searches = [WebSearchTool.model_construct(reasoning="r", query=f"q{i}", max_results=5) for i in range(3)]
+        other = SlowTool(label="a")
+
+        limited = agent._limit_parallel_tools([searches[0], searches[1], other, searches[2]])
+
+        assert limited == [searches[0], other]
@@ -0,0 +1,134 @@
+"""Tests for conversation compaction.
+
+This module contains tests for ContextCompactor,
+SummarizingContextCompactor and their use in BaseAgent.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from sgr_deep_research.core.agent_definition import ExecutionConfig
+from sgr_deep_research.core.base_agent import BaseAgent
+from sgr_deep_research.core.services import ContextCompactor, SummarizingContextCompactor
+from tests.conftest import create_test_agent
+
+
+def tool_result(number: int, size: int = 4000) -> str:
+    return f"Search Query: query {number}\n\n[{number}] Title {number} - https://example.com/{number}\n" + "x" * size
+
+
+def build_conversation(results: int) -> list[dict]:
+    conversation = [{"role": "user", "content": "task"}]
+    for i in range(1, results + 1):
+        conversation.append({"role": "assistant", "content": None, "tool_calls": []})
+        conversation.append({"role": "tool", "content": tool_result(i), "tool_call_id": f"{i}-action"})
+    return conversation
+
+
+class TestContextCompactor:
+    """Tests for eliding old tool results."""
+
+    @pytest.mark.asyncio
+    async def test_below_threshold_is_untouched(self):
+        compactor = ContextCompactor(threshold_tokens=100000)
+        conversation = build_conversation(3)
+
+        assert await compactor.compact(conversation) is False
+        assert conversation == build_conversation(3)
+
+    @pytest.mark.asyncio
+    async def test_old_results_elided_recent_kept(self):
+        compactor = ContextCompactor(threshold_tokens=1000, keep_last=2, stub_chars=30)
+        conversation = build_conversation(4)
+
+        assert await compactor.compact(conversation) is True
+
+        tool_messages = [message for message in conversation if message["role"] == "tool"]
+        assert all("chars elided" in message["content"] for message in tool_messages[:2])
+        assert [message["content"] for message in tool_messages[2:]] == [tool_result(3), tool_result(4)]
+        assert ContextCompactor.estimate_tokens(conversation) < ContextCompactor.estimate_tokens(build_conversation(4))
+
+    @pytest.mark.asyncio
+    async def test_stub_keeps_source_references(self):
+        compactor = ContextCompactor(threshold_tokens=0, keep_last=0, stub_chars=10)
+        conversation = build_conversation(1)
+
+        await compactor.compact(conversation)
+
+        assert "[1] Title 1 - https://example.com/1" in conversation[-1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_compacted_messages_are_stable(self):
+        compactor = ContextCompactor(threshold_tokens=0, keep_last=0, stub_chars=10)
+        conversation = build_conversation(2)
+        await compactor.compact(conversation)
+        compacted = [message["content"] for message in conversation]
+
+        assert await compactor.compact(conversation) is False
+        assert [message["content"] for message in conversation] == compacted
+
+
+class TestSummarizingContextCompactor:
+    """Tests for LLM summarization of old tool results."""
+
+    @staticmethod
+    def create_client(summary: str | Exception) -> Mock:
+        client = Mock()
+        if isinstance(summary, Exception):
+            client.chat.completions.create = AsyncMock(side_effect=summary)
+        else:
+            completion = Mock()
+            completion.choices = [Mock(message=Mock(content=summary))]
+            client.chat.completions.create = AsyncMock(return_value=completion)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_results_summarized_with_model(self):
+        client = self.create_client("short summary")
+        compactor = SummarizingContextCompactor(
+            threshold_tokens=0, openai_client=client, model="cheap-model", keep_last=0
+        )
+        conversation = build_conversation(1)
+
+        await compactor.compact(conversation)
+
+        assert client.chat.completions.create.call_args.kwargs["model"] == "cheap-model"
+        assert "short summary" in conversation[-1]["content"]
+        assert "[1] Title 1 - https://example.com/1" in conversation[-1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_stub_on_error(self):
+        compactor = SummarizingContextCompactor(
+            threshold_tokens=0, openai_client=self.create_client(RuntimeError("boom")), model="cheap-model", keep_last=0
+        )
+        conversation = build_conversation(1)
+
+        await compactor.compact(conversation)
+
+        assert "chars elided" in conversation[-1]["content"]
+
+
+class TestBaseAgentCompaction:
+    """Tests for compaction in BaseAgent context preparation."""
+
+    def test_compactor_created_from_config(self):
+        agent = create_test_agent(BaseAgent, execution_config=ExecutionConfig(compaction_model="cheap-model"))
+        assert isinstance(agent.context_compactor, SummarizingContextCompactor)
+
+        agent = create_test_agent(BaseAgent, execution_config=ExecutionConfig(compaction_threshold_tokens=0))
+        assert agent.context_compactor is None
+
+    @pytest.mark.asyncio
+    async def test_prepare_context_compacts_conversation(self):
+        agent = create_test_agent(
+            BaseAgent,
+            execution_config=ExecutionConfig(compaction_threshold_tokens=1000, compaction_keep_last=1),
+        )
+        agent.conversation = build_conversation(3)
+
+        context = await agent._prepare_context()
+
+        assert context[0]["role"] == "system"
+        assert "chars elided" in agent.conversation[2]["content"]
+        assert agent.conversation[-1]["content"] == tool_result(3)
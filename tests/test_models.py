@@ -222,6 +222,18 @@ class TestResearchContext:
         assert "https://example.com" in context.sources
         assert context.sources["https://example.com"].number == 1
 
+    def test_research_context_add_source_numbering(self):
+        """Test that add_source assigns unique numbers and keeps known URLs."""
+        context = ResearchContext()
+        first = context.add_source(SourceData(number=0, url="https://example.com/1"))
+        second = context.add_source(SourceData(number=0, url="https://example.com/2"))
+        duplicate = context.add_source(SourceData(number=0, url="https://example.com/1"))
+        third = context.add_source(SourceData(number=0, url="https://example.com/3"))
+
+        assert [first.number, second.number, third.number] == [1, 2, 3]
+        assert duplicate is first
+        assert len(context.sources) == 3
+
     def test_research_context_searches_used(self):
         """Test tracking number of searches used."""
         context = ResearchContext()
@@ -0,0 +1,73 @@
+"""Tests for tool schema builders.
+
+This module contains tests for NextStepToolsBuilder and
+FunctionToolsBuilder memoization and ordering.
+"""
+
+from sgr_deep_research.core.tools import (
+    ClarificationTool,
+    FinalAnswerTool,
+    FunctionToolsBuilder,
+    NextStepToolsBuilder,
+    WebSearchTool,
+)
+
+
+class TestNextStepToolsBuilder:
+    """Tests for NextStepTools model memoization."""
+
+    def test_same_toolset_returns_same_model(self):
+        """Test that the model is built once per set of tools."""
+        first = NextStepToolsBuilder.build_NextStepTools([WebSearchTool, FinalAnswerTool])
+        second = NextStepToolsBuilder.build_NextStepTools([FinalAnswerTool, WebSearchTool])
+
+        assert first is second
+
+    def test_different_toolsets_return_different_models(self):
+        """Test that different sets of tools get separate models."""
+        first = NextStepToolsBuilder.build_NextStepTools([WebSearchTool, FinalAnswerTool])
+        second = NextStepToolsBuilder.build_NextStepTools([FinalAnswerTool])
+
+        assert first is not second
+
+    def test_schema_is_independent_of_tool_order(self):
+        """Test that schema is byte-stable regardless of input order."""
+        NextStepToolsBuilder._cache.clear()
+        first_schema = NextStepToolsBuilder.build_NextStepTools(
+            [WebSearchTool, ClarificationTool, FinalAnswerTool]
+        ).model_json_schema()
+        NextStepToolsBuilder._cache.clear()
+        second_schema = NextStepToolsBuilder.build_NextStepTools(
+            [FinalAnswerTool, WebSearchTool, ClarificationTool]
+        ).model_json_schema()
+
+        assert first_schema == second_schema
+
+
+class TestFunctionToolsBuilder:
+    """Tests for function calling tool params memoization."""
+
+    def test_tools_are_sorted_by_name(self):
+        """Test that tools come in deterministic order."""
+        tools = FunctionToolsBuilder.build_function_tools({WebSearchTool, FinalAnswerTool, ClarificationTool})
+
+        assert [tool["function"]["name"] for tool in tools] == [
+            ClarificationTool.tool_name,
+            FinalAnswerTool.tool_name,
+            WebSearchTool.tool_name,
+        ]
+
+    def test_same_toolset_reuses_params(self):
+        """Test that tool params are generated once per set of tools."""
+        first = FunctionToolsBuilder.build_function_tools([WebSearchTool, FinalAnswerTool])
+        second = FunctionToolsBuilder.build_function_tools({FinalAnswerTool, WebSearchTool})
+
+        assert first == second
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_returned_list_can_be_modified_safely(self):
+        """Test that callers can't corrupt the cache by mutating result."""
+        tools = FunctionToolsBuilder.build_function_tools([WebSearchTool])
+        tools.clear()
+
+        assert len(FunctionToolsBuilder.build_function_tools([WebSearchTool])) == 1
@@ -279,6 +279,35 @@ class TestPromptLoader:
             date_part = parts[0]
             assert len(date_part) == 19  # YYYY-MM-DD HH:MM:SS
 
+    def test_get_system_prompt_is_memoized(self):
+        """Test that system prompt is formatted once and stays byte-
+        identical."""
+
+        class MockTool(BaseTool):
+            tool_name = "mock_tool"
+            description = "Mock tool"
+
+        prompts_config = PromptsConfig(system_prompt_str="Tools:\n{available_tools}")
+
+        first = PromptLoader.get_system_prompt([MockTool], prompts_config)
+        second = PromptLoader.get_system_prompt([MockTool], prompts_config)
+
+        assert first is second
+        assert PromptLoader.get_system_prompt([], prompts_config) == "Tools:\n"
+
+    def test_current_date_format_is_configurable(self):
+        """Test that coarser date format is used in user request and
+        clarification templates."""
+        prompts_config = PromptsConfig(
+            initial_user_request_str="{current_date}|{task}",
+            clarification_response_str="{current_date}|{clarifications}",
+            current_date_format="%Y-%m-%d",
+        )
+        today = datetime.now().strftime("%Y-%m-%d")
+
+        assert PromptLoader.get_initial_user_request("task", prompts_config) == f"{today}|task"
+        assert PromptLoader.get_clarification_template("answer", prompts_config) == f"{today}|answer"
+
     def test_load_prompt_file_falls_back_to_lib_dir(self):
         """Test that PromptsConfig can load files from default library
         directory."""
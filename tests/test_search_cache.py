@@ -0,0 +1,210 @@
+"""Tests for search caching.
+
+This module contains tests for TTLCache and cached
+TavilySearchService.search and TavilySearchService.extract.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from sgr_deep_research.core.agent_definition import SearchConfig
+from sgr_deep_research.core.services import TavilySearchService, TTLCache
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake_clock = FakeClock()
+    with patch("sgr_deep_research.core.services.cache.time.time", fake_clock):
+        yield fake_clock
+
+
+class TestTTLCache:
+    """Tests for TTLCache memory and disk tiers."""
+
+    @pytest.mark.asyncio
+    async def test_miss_then_hit(self, clock):
+        cache = TTLCache("test", ttl=10)
+
+        assert await cache.get("key") == (None, False)
+        await cache.set("key", {"value": 1})
+
+        assert await cache.get("key") == ({"value": 1}, True)
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_entry_expires(self, clock):
+        cache = TTLCache("test", ttl=10)
+        await cache.set("key", "value")
+
+        clock.now += 11
+
+        assert await cache.get("key") == (None, False)
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_within_stale_ttl(self, clock):
+        cache = TTLCache("test", ttl=10, stale_ttl=10)
+        await cache.set("key", "value")
+
+        clock.now += 15
+        assert await cache.get("key") == ("value", False)
+        assert cache.stats.stale_hits == 1
+
+        clock.now += 10
+        assert await cache.get("key") == (None, False)
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self, clock):
+        cache = TTLCache("test", ttl=10, max_entries=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+
+        assert (await cache.get("a"))[0] == 1
+        assert (await cache.get("b"))[0] is None
+        assert (await cache.get("c"))[0] == 3
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_restart(self, clock, tmp_path):
+        db_path = str(tmp_path / "cache.sqlite")
+        cache = TTLCache("test", ttl=10, db_path=db_path)
+        await cache.set("key", ["value"])
+        cache.close()
+
+        restarted_cache = TTLCache("test", ttl=10, db_path=db_path)
+
+        assert await restarted_cache.get("key") == (["value"], True)
+        assert restarted_cache.stats.disk_hits == 1
+        restarted_cache.close()
+
+
+class TestCachedSearch:
+    """Tests for TavilySearchService.search caching."""
+
+    @staticmethod
+    def tavily_response(query: str) -> dict:
+        return {"results": [{"url": f"https://example.com/{query}", "title": query, "content": "snippet"}]}
+
+    @pytest.fixture
+    def service(self):
+        service = TavilySearchService(SearchConfig(tavily_api_key="test_key", cache_ttl=10, cache_stale_ttl=10))
+        service._client.search = AsyncMock(side_effect=lambda query, **kwargs: self.tavily_response(query))
+        return service
+
+    @pytest.mark.asyncio
+    async def test_normalized_query_hits_cache(self, service):
+        first = await service.search("SGR  Deep Research", max_results=5)
+        second = await service.search("sgr deep research ", max_results=5)
+
+        assert service._client.search.call_count == 1
+        assert [s.url for s in first] == [s.url for s in second]
+        assert service.search_cache.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_different_parameters_miss_cache(self, service):
+        await service.search("query", max_results=5)
+        await service.search("query", max_results=3)
+        await service.search("query", max_results=5, include_raw_content=False)
+
+        assert service._client.search.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cached_sources_are_independent_copies(self, service):
+        first = await service.search("query", max_results=5)
+        first[0].number = 42
+
+        second = await service.search("query", max_results=5)
+
+        assert second[0].number != 42
+
+    @pytest.mark.asyncio
+    async def test_stale_result_revalidated_in_background(self, service, clock):
+        await service.search("query", max_results=5)
+        clock.now += 15
+
+        stale = await service.search("query", max_results=5)
+        await asyncio.gather(*service._revalidation_tasks.values())
+
+        assert stale[0].url == "https://example.com/query"
+        assert service._client.search.call_count == 2
+        assert (await service.search_cache.get(service._search_cache_key("query", 5, True)))[1] is True
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self):
+        service = TavilySearchService(SearchConfig(tavily_api_key="test_key", cache_ttl=0))
+        service._client.search = AsyncMock(return_value=self.tavily_response("query"))
+
+        await service.search("query")
+        await service.search("query")
+
+        assert service.search_cache is None
+        assert service._client.search.call_count == 2
+
+
+class TestCachedExtract:
+    """Tests for TavilySearchService.extract page caching."""
+
+    @staticmethod
+    def tavily_response(urls: list[str]) -> dict:
+        return {
+            "results": [{"url": url, "raw_content": f"content of {url}"} for url in urls if "broken" not in url],
+            "failed_results": [{"url": url, "error": "failed"} for url in urls if "broken" in url],
+        }
+
+    @pytest.fixture
+    def service(self):
+        service = TavilySearchService(SearchConfig(tavily_api_key="test_key"))
+        service._client.extract = AsyncMock(side_effect=lambda urls, **kwargs: self.tavily_response(urls))
+        return service
+
+    @pytest.mark.asyncio
+    async def test_only_missing_urls_are_extracted(self, service):
+        await service.extract(["https://a.com"])
+
+        sources = await service.extract(["https://b.com", "https://a.com"])
+
+        assert service._client.extract.call_args_list[-1].kwargs["urls"] == ["https://b.com"]
+        assert [source.url for source in sources] == ["https://b.com", "https://a.com"]
+        assert sources[1].full_content == "content of https://a.com"
+
+    @pytest.mark.asyncio
+    async def test_fully_cached_request_skips_tavily(self, service):
+        await service.extract(["https://a.com", "https://b.com"])
+        await service.extract(["https://a.com", "https://b.com#section"])
+
+        assert service._client.extract.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_urls_are_negatively_cached(self, service, clock):
+        sources = await service.extract(["https://broken.com", "https://a.com"])
+        assert [source.url for source in sources] == ["https://a.com"]
+
+        await service.extract(["https://broken.com"])
+        assert service._client.extract.call_count == 1
+
+        clock.now += service._search_config.page_cache_failed_ttl + 1
+        await service.extract(["https://broken.com"])
+        assert service._client.extract.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_page_cache_is_size_bounded(self):
+        service = TavilySearchService(SearchConfig(tavily_api_key="test_key", page_cache_max_bytes=200))
+        service._client.extract = AsyncMock(side_effect=lambda urls, **kwargs: self.tavily_response(urls))
+
+        for i in range(10):
+            await service.extract([f"https://example.com/{i}"])
+
+        assert service.page_cache.memory_bytes <= 200
+        assert service.page_cache.stats.evictions > 0
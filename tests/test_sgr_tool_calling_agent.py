@@ -0,0 +1,124 @@
+"""Tests for SGRToolCallingAgent.
+
+This module contains tests for the fused reasoning mode, where reasoning
+and action are produced by a single LLM call per step.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from sgr_deep_research.core.agent_definition import ExecutionConfig
+from sgr_deep_research.core.agents import SGRToolCallingAgent
+from sgr_deep_research.core.tools import FinalAnswerTool, NextStepToolsBuilder, ReasoningTool, WebSearchTool
+from tests.conftest import create_test_agent
+
+
+class FakeStream:
+    def __init__(self, completion):
+        self.completion = completion
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        raise StopAsyncIteration
+
+    async def get_final_completion(self):
+        return self.completion
+
+
+def create_completion(parsed_arguments) -> Mock:
+    tool_call = Mock()
+    tool_call.function.parsed_arguments = parsed_arguments
+    completion = Mock()
+    completion.choices = [Mock(message=Mock(tool_calls=[tool_call], content=None))]
+    completion.usage = None
+    return completion
+
+
+REASONING_FIELDS = dict(
+    reasoning_steps=["Step 1", "Step 2"],
+    current_situation="Starting",
+    plan_status="Planned",
+    enough_data=False,
+    remaining_steps=["Search"],
+    task_completed=False,
+)
+
+
+class TestSGRToolCallingAgentFusedReasoning:
+    """Tests for reasoning and action in one LLM call."""
+
+    def create_agent(self, fused_reasoning: bool) -> SGRToolCallingAgent:
+        return create_test_agent(
+            SGRToolCallingAgent,
+            execution_config=ExecutionConfig(fused_reasoning=fused_reasoning),
+            toolkit=[WebSearchTool, FinalAnswerTool],
+        )
+
+    @staticmethod
+    def create_next_step():
+        next_step_tools = NextStepToolsBuilder.build_NextStepTools([WebSearchTool, FinalAnswerTool])
+        return next_step_tools(
+            **REASONING_FIELDS,
+            function={
+                "tool_name_discriminator": WebSearchTool.tool_name,
+                "reasoning": "r",
+                "query": "q",
+                "max_results": 5,
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_fused_step_makes_single_llm_call(self):
+        agent = self.create_agent(fused_reasoning=True)
+        agent.openai_client.chat.completions.stream = Mock(
+            return_value=FakeStream(create_completion(self.create_next_step()))
+        )
+
+        reasoning = await agent._reasoning_phase()
+        tools = await agent._select_action_phase(reasoning)
+
+        assert agent.openai_client.chat.completions.stream.call_count == 1
+        assert isinstance(tools[0], WebSearchTool)
+        assert tools[0].query == "q"
+        call_kwargs = agent.openai_client.chat.completions.stream.call_args.kwargs
+        assert [tool["function"]["name"] for tool in call_kwargs["tools"]] == [ReasoningTool.tool_name]
+
+    @pytest.mark.asyncio
+    async def test_fused_conversation_matches_two_call_mode(self):
+        agent = self.create_agent(fused_reasoning=True)
+        agent.openai_client.chat.completions.stream = Mock(
+            return_value=FakeStream(create_completion(self.create_next_step()))
+        )
+
+        await agent._select_action_phase(await agent._reasoning_phase())
+
+        reasoning_call, reasoning_result, action_call = agent.conversation
+        assert reasoning_call["tool_calls"][0]["function"]["name"] == ReasoningTool.tool_name
+        assert "function" not in reasoning_call["tool_calls"][0]["function"]["arguments"]
+        assert reasoning_result["role"] == "tool"
+        assert action_call["tool_calls"][0]["function"]["name"] == WebSearchTool.tool_name
+
+    @pytest.mark.asyncio
+    async def test_default_mode_makes_two_llm_calls(self):
+        agent = self.create_agent(fused_reasoning=False)
+        action = WebSearchTool(reasoning="r", query="q", max_results=5)
+        agent.openai_client.chat.completions.stream = Mock(
+            side_effect=[
+                FakeStream(create_completion(ReasoningTool(**REASONING_FIELDS))),
+                FakeStream(create_completion(action)),
+            ]
+        )
+
+        tools = await agent._select_action_phase(await agent._reasoning_phase())
+
+        assert agent.openai_client.chat.completions.stream.call_count == 2
+        assert tools == [action]
@@ -377,6 +377,18 @@ class TestOpenAIStreamingGenerator:
         assert "completion_tokens" in data["usage"]
         assert "total_tokens" in data["usage"]
 
+    @pytest.mark.asyncio
+    async def test_finish_reports_given_usage(self):
+        """Test that final chunk reports accumulated usage."""
+        generator = OpenAIStreamingGenerator()
+        usage = {"prompt_tokens": 100, "completion_tokens": 20, "total_tokens": 120}
+        generator.finish(usage=usage)
+
+        items = [item async for item in generator.stream()]
+        data = json.loads(items[-2][6:].strip())
+
+        assert data["usage"] == usage
+
     @pytest.mark.asyncio
     async def test_finish_adds_done_marker(self):
         """Test that finish() adds [DONE] marker."""
@@ -7,6 +7,10 @@ This module contains simple tests for all tools:
 
 from unittest.mock import Mock, patch
 
+import pytest
+
+from sgr_deep_research.core.agent_definition import SearchConfig
+from sgr_deep_research.core.services import TavilySearchService
 from sgr_deep_research.core.tools import (
     AdaptPlanTool,
     ClarificationTool,
@@ -178,3 +182,43 @@ class TestToolsConfigReading:
             )
             # Tool should be initialized without errors
             assert tool.title == "Test Report"
+
+
+class TestSearchServiceSharing:
+    """Test that search tools share long-lived search services."""
+
+    def teardown_method(self):
+        TavilySearchService._instances.clear()
+
+    def test_tool_construction_does_not_create_search_service(self):
+        """Test that parsing tool call into a tool doesn't set up network clients."""
+        with patch("sgr_deep_research.core.tools.extract_page_content_tool.TavilySearchService") as mock_service:
+            ExtractPageContentTool(reasoning="Test", urls=["https://example.com"])
+            mock_service.assert_not_called()
+            mock_service.get_instance.assert_not_called()
+
+    def test_get_instance_reuses_service_for_same_config(self):
+        """Test that the same search config yields one shared service."""
+        search_config = SearchConfig(tavily_api_key="test_key")
+
+        service = TavilySearchService.get_instance(search_config)
+
+        assert TavilySearchService.get_instance(search_config.model_copy()) is service
+        assert TavilySearchService.get_instance(search_config.model_copy(update={"max_results": 3})) is service
+
+    def test_get_instance_separates_different_configs(self):
+        """Test that different API keys get separate services."""
+        service = TavilySearchService.get_instance(SearchConfig(tavily_api_key="test_key"))
+
+        assert TavilySearchService.get_instance(SearchConfig(tavily_api_key="other_key")) is not service
+
+    @pytest.mark.asyncio
+    async def test_close_all_drops_services(self):
+        """Test that closing services recreates them on next use."""
+        search_config = SearchConfig(tavily_api_key="test_key")
+        service = TavilySearchService.get_instance(search_config)
+
+        await TavilySearchService.close_all()
+
+        assert TavilySearchService._instances == {}
+        assert TavilySearchService.get_instance(search_config) is not service